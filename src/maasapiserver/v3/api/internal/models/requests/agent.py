@@ -1,11 +1,26 @@
 #  Copyright 2024-2025 Canonical Ltd.  This software is licensed under the
 #  GNU Affero General Public License version 3 (see the file LICENSE).
 
+import re
+
 from OpenSSL import crypto
 from pydantic import BaseModel, Field, validator
 
 from maasservicelayer.exceptions.catalog import ValidationException
 
+# OpenSSL skips anything preceding the PEM header, so only require that the
+# header is present somewhere, on a line of its own.
+_PEM_CSR_HEADER_RE = re.compile(
+    r"^-----BEGIN (NEW )?CERTIFICATE REQUEST-----\r?$", re.MULTILINE
+)
+
+
+def _invalid_csr() -> ValidationException:
+    return ValidationException.build_for_field(
+        field="csr",
+        message="Invalid PEM certificate.",
+    )
+
 
 class AgentEnrollRequest(BaseModel):
     secret: str = Field(
@@ -18,14 +33,14 @@ class AgentEnrollRequest(BaseModel):
 
     @validator("csr")
     def validate_csr(cls, value: str) -> str:
+        # Reject values without a PEM header before trying to parse them.
+        if _PEM_CSR_HEADER_RE.search(value) is None:
+            raise _invalid_csr()
         try:
             crypto.load_certificate_request(
                 crypto.FILETYPE_PEM, value.encode()
             )
         except Exception as e:
-            raise ValidationException.build_for_field(
-                field="csr",
-                message="Invalid PEM certificate.",
-            ) from e
+            raise _invalid_csr() from e
 
         return value
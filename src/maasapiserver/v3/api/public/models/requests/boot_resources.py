@@ -85,11 +85,13 @@ class BootResourceCreateRequest(BaseModel):
         ),
     ]
 
-    def _get_supported_operating_systems(self) -> dict[str, OperatingSystem]:
+    @classmethod
+    def _get_supported_operating_systems(cls) -> dict[str, OperatingSystem]:
         return {os_name: os for os_name, os in OperatingSystemRegistry}
 
+    @classmethod
     async def _get_reserved_os_names(
-        self,
+        cls,
         supported_osystems: list[str],
         services: ServiceCollectionV3,
     ) -> list[str]:
@@ -108,11 +110,12 @@ class BootResourceCreateRequest(BaseModel):
         reserved_names.extend(supported_osystems)
         return reserved_names
 
+    @classmethod
     async def _validate_name(
-        self, name: str, services: ServiceCollectionV3
+        cls, name: str, services: ServiceCollectionV3
     ) -> str:
         supported_osystems = list(
-            self._get_supported_operating_systems().keys()
+            cls._get_supported_operating_systems().keys()
         )
 
         if "/" in name:
@@ -132,7 +135,7 @@ class BootResourceCreateRequest(BaseModel):
                     location="header",
                 )
 
-        reserved_names = await self._get_reserved_os_names(
+        reserved_names = await cls._get_reserved_os_names(
             supported_osystems, services
         )
 
@@ -145,8 +148,9 @@ class BootResourceCreateRequest(BaseModel):
             )
         return name
 
+    @classmethod
     async def _validate_architecture(
-        self, architecture: str, services: ServiceCollectionV3
+        cls, architecture: str, services: ServiceCollectionV3
     ) -> str:
         architecture = architecture.lower().strip()
 
@@ -170,8 +174,9 @@ class BootResourceCreateRequest(BaseModel):
                 location="header",
             )
 
+    @classmethod
     async def _get_base_image_info(
-        self,
+        cls,
         base_image: str | None,
         name: str,
         architecture: str,
@@ -204,8 +209,9 @@ class BootResourceCreateRequest(BaseModel):
         osystem, version = base_image.split("/")
         return (osystem.lower(), version.lower())
 
+    @classmethod
     async def _validate_base_image(
-        self,
+        cls,
         base_image: str | None,
         name: str,
         architecture: str,
@@ -218,7 +224,7 @@ class BootResourceCreateRequest(BaseModel):
         base_osystem: str = ""
         base_version: str = ""
         try:
-            base_osystem, base_version = await self._get_base_image_info(
+            base_osystem, base_version = await cls._get_base_image_info(
                 base_image, name, architecture, services
             )
         except ValueError:
@@ -250,7 +256,7 @@ class BootResourceCreateRequest(BaseModel):
                     location="header",
                 )
 
-        supported_base_images = self._get_supported_operating_systems()
+        supported_base_images = cls._get_supported_operating_systems()
         if not (
             base_osystem in supported_base_images
             and supported_base_images[base_osystem].is_release_supported(
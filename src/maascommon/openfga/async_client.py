@@ -1,6 +1,9 @@
 # Copyright 2026 Canonical Ltd.  This software is licensed under the
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
+import asyncio
+from typing import Self, Sequence
+
 import httpx
 
 from maascommon.enums.openfga import (
@@ -13,9 +16,16 @@ from maascommon.openfga.base import (
 )
 
 
+class OpenFGABatchCheckError(Exception):
+    """A check in a batch-check request has no result or failed."""
+
+
 class OpenFGAClient(BaseOpenFGAClient):
     """Asynchronous client for interacting with OpenFGA API."""
 
+    # OpenFGA's default limit on the number of checks in a batch-check request.
+    MAX_CHECKS_PER_BATCH_CHECK = 50
+
     def __init__(self, unix_socket: str | None = None):
         super().__init__(unix_socket)
         self.client = self._init_client()
@@ -31,6 +41,12 @@ class OpenFGAClient(BaseOpenFGAClient):
     async def close(self):
         await self.client.aclose()
 
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_t, exc_v, exc_tb):
+        await self.close()
+
     async def _check(self, user_id: int, relation: str, obj: str) -> bool:
         response = await self.client.post(
             f"/stores/{OPENFGA_STORE_ID}/check",
@@ -46,6 +62,57 @@ class OpenFGAClient(BaseOpenFGAClient):
         response.raise_for_status()
         return response.json().get("allowed", False)
 
+    async def _batch_check(
+        self, checks: Sequence[tuple[int, str, str]]
+    ) -> list[bool]:
+        response = await self.client.post(
+            f"/stores/{OPENFGA_STORE_ID}/batch-check",
+            json={
+                "checks": [
+                    {
+                        "tuple_key": {
+                            "user": f"user:{user_id}",
+                            "relation": relation,
+                            "object": obj,
+                        },
+                        "correlation_id": str(i),
+                    }
+                    for i, (user_id, relation, obj) in enumerate(checks)
+                ],
+                "authorization_model_id": OPENFGA_AUTHORIZATION_MODEL_ID,
+            },
+        )
+        response.raise_for_status()
+        result = response.json().get("result", {})
+        allowed = []
+        for i, check in enumerate(checks):
+            # Don't turn a missing or failed check into a silent deny.
+            entry = result.get(str(i))
+            if entry is None:
+                raise OpenFGABatchCheckError(f"No result for check {check}.")
+            if entry.get("error"):
+                raise OpenFGABatchCheckError(
+                    f"Check {check} failed: {entry['error']}"
+                )
+            allowed.append(entry.get("allowed", False))
+        return allowed
+
+    async def batch_check(
+        self, checks: Sequence[tuple[int, str, str]]
+    ) -> list[bool]:
+        """Run several (user_id, relation, object) checks at once.
+
+        The results are returned in the same order as the checks.
+        """
+        batches = [
+            checks[i : i + self.MAX_CHECKS_PER_BATCH_CHECK]
+            for i in range(0, len(checks), self.MAX_CHECKS_PER_BATCH_CHECK)
+        ]
+        results = await asyncio.gather(
+            *(self._batch_check(batch) for batch in batches)
+        )
+        return [allowed for result in results for allowed in result]
+
     async def _list_objects(
         self, user_id: int, relation: str, obj_type: str
     ) -> list[int]:
@@ -75,19 +75,33 @@ class OpenFGATuplesRepository(Repository):
         return items
 
     async def upsert(self, builder: OpenFGATupleBuilder) -> OpenFGATuple:
-        resource = self.get_mapper().build_resource(builder)
-
+        [result] = await self.upsert_many([builder])
+        return result
+
+    async def upsert_many(
+        self, builders: list[OpenFGATupleBuilder]
+    ) -> list[OpenFGATuple]:
+        """Upsert all the tuples with a single multi-row statement.
+
+        The builders must not contain the same tuple more than once. The
+        tuples are returned in the same order as the builders.
+        """
+        if not builders:
+            return []
+        mapper = self.get_mapper()
         new_timestamp = utcnow()
-        new_ulid = generate_ulid()
 
-        values = {
-            **resource.get_values(),
-            "store": OPENFGA_STORE_ID,
-            "inserted_at": new_timestamp,
-            "ulid": new_ulid,
-        }
+        values = [
+            {
+                **mapper.build_resource(builder).get_values(),
+                "store": OPENFGA_STORE_ID,
+                "inserted_at": new_timestamp,
+                "ulid": generate_ulid(),
+            }
+            for builder in builders
+        ]
 
-        stmt = insert(OpenFGATupleTable).values(**values)
+        stmt = insert(OpenFGATupleTable).values(values)
 
         stmt = stmt.on_conflict_do_update(
             index_elements=[
@@ -98,16 +112,25 @@ class OpenFGATuplesRepository(Repository):
                 "_user",
             ],
             set_={
-                "inserted_at": new_timestamp,
-                "ulid": new_ulid,
+                "inserted_at": stmt.excluded.inserted_at,
+                "ulid": stmt.excluded.ulid,
             },
         ).returning(OpenFGATupleTable)
 
-        result = (await self.execute_stmt(stmt)).one()
-        result_dict = result._asdict()
-
-        result_dict["user"] = result_dict.pop("_user")
-        return OpenFGATuple(**result_dict)
+        result = await self.execute_stmt(stmt)
+        # RETURNING doesn't guarantee the order of the VALUES list, so match
+        # the rows back to the values by their primary key.
+        key = ("object_type", "object_id", "relation", "_user")
+        rows = {
+            tuple(row_asdict[name] for name in key): row_asdict
+            for row_asdict in (row._asdict() for row in result)
+        }
+        items = []
+        for value in values:
+            row_asdict = rows[tuple(value[name] for name in key)]
+            row_asdict["user"] = row_asdict.pop("_user")
+            items.append(OpenFGATuple(**row_asdict))
+        return items
 
     async def delete_many(self, query: QuerySpec) -> None:
         stmt = delete(OpenFGATupleTable).returning(OpenFGATupleTable)
@@ -429,15 +429,15 @@ class ImageSyncService(Service):
                     product,
                 )
                 for resource in to_download:
-                    if existent := resources_to_download.get(resource.sha256):
+                    existent = resources_to_download.setdefault(
+                        resource.sha256, resource
+                    )
+                    if existent is not resource:
                         # Multiple requests for the same SHA256 are combined in a single operation.
                         existent.rfile_ids.extend(resource.rfile_ids)
                         existent.source_list.extend(resource.source_list)
                         existent.extract_paths.extend(resource.extract_paths)
 
-                    else:
-                        resources_to_download[resource.sha256] = resource
-
         return list(resources_to_download.values())
 
     async def get_files_to_download_from_product(
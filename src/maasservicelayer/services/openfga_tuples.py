@@ -164,6 +164,11 @@ class OpenFGATupleService(Service):
     async def upsert(self, builder: OpenFGATupleBuilder) -> OpenFGATuple:
         return await self.openfga_tuple_repository.upsert(builder)
 
+    async def upsert_many(
+        self, builders: list[OpenFGATupleBuilder]
+    ) -> list[OpenFGATuple]:
+        return await self.openfga_tuple_repository.upsert_many(builders)
+
     async def delete_many(self, query: QuerySpec) -> None:
         return await self.openfga_tuple_repository.delete_many(query)
 
@@ -678,9 +678,7 @@ class SyncBootResourcesWorkflow:
             GET_BOOTRESOURCEFILE_ENDPOINTS_ACTIVITY_NAME,
             start_to_close_timeout=timedelta(seconds=30),
         )
-        regions = frozenset(region_endpoints.keys())
-
-        if len(regions) < 2:
+        if len(region_endpoints) < 2:
             return
 
         # sync the resource with the other regions
@@ -698,7 +696,7 @@ class SyncBootResourcesWorkflow:
                 f"File {input.resource.sha256} has no complete copy available"
             )
 
-        missing_regions = regions - set(synced_regions)
+        missing_regions = region_endpoints.keys() - synced_regions
 
         # Use a random generator from the temporal sdk in order to keep the workflow deterministic.
         random_generator = random()
@@ -748,8 +746,7 @@ class DeleteBootResourceWorkflow:
             GET_BOOTRESOURCEFILE_ENDPOINTS_ACTIVITY_NAME,
             start_to_close_timeout=timedelta(seconds=30),
         )
-        regions = frozenset(endpoints.keys())
-        for r in regions:
+        for r in endpoints:
             await workflow.execute_activity(
                 DELETE_BOOTRESOURCEFILE_ACTIVITY_NAME,
                 input,
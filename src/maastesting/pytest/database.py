@@ -150,21 +150,29 @@ def templatemaasdb(pytestconfig):
         )
 
 
-@pytest.fixture
-def ensuremaasdb(request, templatemaasdb, pytestconfig, worker_id):
-    template = pytestconfig.stash[db_template_stash]
-    dbname = f"{template}_{worker_id}"
-    cluster = pytestconfig.stash[cluster_stash]
-    template = pytestconfig.stash[db_template_stash]
+def ensure_db_from_template(cluster, template, dbname, recreate=False):
+    """Create `dbname` from `template` unless it already exists."""
     with (
         cluster.lock.exclusive,
         connect(cluster) as conn,
         conn.cursor() as cursor,
     ):
-        if request.node.get_closest_marker("recreate_db"):
+        if recreate:
             cursor.execute(f"DROP DATABASE IF EXISTS {dbname}")
         if dbname not in cluster.databases:
             cursor.execute(
                 f'CREATE DATABASE "{dbname}" WITH TEMPLATE "{template}"'
             )
+
+
+@pytest.fixture
+def ensuremaasdb(request, templatemaasdb, pytestconfig, worker_id):
+    template = pytestconfig.stash[db_template_stash]
+    dbname = f"{template}_{worker_id}"
+    ensure_db_from_template(
+        pytestconfig.stash[cluster_stash],
+        template,
+        dbname,
+        recreate=request.node.get_closest_marker("recreate_db") is not None,
+    )
     yield dbname
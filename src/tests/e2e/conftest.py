@@ -1,35 +1,63 @@
 # Copyright 2026 Canonical Ltd.  This software is licensed under the
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
+import asyncio
 from datetime import timedelta
 import os
-import subprocess
-import time
+from os.path import abspath
+from typing import AsyncIterator, Iterator
 
 import pytest
-import yaml
-
-from tests.maasapiserver.fixtures.db import db, db_connection, test_config
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from maasapiserver.settings import Config, DatabaseConfig
+from maascommon.openfga.async_client import OpenFGAClient
+from maasservicelayer.db import Database
+from maasservicelayer.db.tables import OpenFGATupleTable
+from maastesting.pytest.database import (
+    cluster_stash,
+    db_template_stash,
+    ensure_db_from_template,
+)
+from tests.maasapiserver.fixtures.db import db
+from tests.maasservicelayer.fixtures import services
 
 __all__ = [
     "db_connection",
+    "openfga_client",
     "db",
+    "e2e_maasdb",
     "test_config",
     "openfga_socket_path",
     "openfga_server",
     "mock_maas_env",
     "project_root_path",
+    "services",
 ]
 
+OPENFGA_TUPLE_KEY = tuple_(
+    OpenFGATupleTable.c.object_type,
+    OpenFGATupleTable.c.object_id,
+    OpenFGATupleTable.c.relation,
+    OpenFGATupleTable.c._user,
+)
 
-@pytest.fixture
-def project_root_path(request):
-    return request.config.rootpath
 
+@pytest.fixture(scope="session")
+def project_root_path(pytestconfig):
+    return pytestconfig.rootpath
 
-@pytest.fixture
-def openfga_socket_path(tmpdir):
-    return tmpdir / "openfga-http.sock"
+
+@pytest.fixture(scope="session")
+def openfga_data_dir(tmp_path_factory, worker_id):
+    """Each xdist worker runs its own OpenFGA server from its own directory."""
+    return tmp_path_factory.mktemp(f"openfga-{worker_id}")
+
+
+@pytest.fixture(scope="session")
+def openfga_socket_path(openfga_data_dir):
+    return openfga_data_dir / "openfga-http.sock"
 
 
 @pytest.fixture
@@ -40,40 +68,114 @@ def mock_maas_env(monkeypatch, openfga_socket_path):
     )
 
 
+@pytest.fixture(scope="session")
+def e2e_maasdb(templatemaasdb, pytestconfig, worker_id) -> str:
+    # The OpenFGA server keeps connections open to this database, so it
+    # can't be recreated between tests like the per-worker test database.
+    template = pytestconfig.stash[db_template_stash]
+    dbname = f"{template}_e2e_{worker_id}"
+    ensure_db_from_template(
+        pytestconfig.stash[cluster_stash], template, dbname, recreate=True
+    )
+    return dbname
+
+
+@pytest.fixture
+def test_config(
+    request: pytest.FixtureRequest, e2e_maasdb: str
+) -> Iterator[Config]:
+    yield Config(
+        db=DatabaseConfig(e2e_maasdb, host=abspath("db/")),
+        debug_queries=request.config.getoption("sqlalchemy_debug"),
+        debug=True,
+    )
+
+
 @pytest.fixture
-def openfga_server(tmpdir, project_root_path, openfga_socket_path, db):
-    """Fixture to start the OpenFGA server as a subprocess for testing. After the test is done, it ensures that the server process is terminated."""
+async def db_connection(db: Database) -> AsyncIterator[AsyncConnection]:
+    # Delete the tuples added by the test, so the session-wide OpenFGA
+    # server starts each test from the same state.
+    conn = await db.engine.connect()
+    initial_tuples = (await conn.execute(select(OPENFGA_TUPLE_KEY))).all()
+    await conn.commit()
+    try:
+        yield conn
+    finally:
+        await conn.rollback()
+        await conn.execute(
+            delete(OpenFGATupleTable).where(
+                OPENFGA_TUPLE_KEY.not_in(initial_tuples)
+            )
+        )
+        await conn.commit()
+        await conn.close()
+
+
+async def _wait_for_socket(socket_path) -> None:
+    """Wait until something accepts connections on the unix socket."""
+    delay = 0.005
+    while True:
+        try:
+            _, writer = await asyncio.open_unix_connection(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
+async def _stop_process(proc: asyncio.subprocess.Process) -> None:
+    """Terminate the process and reap it, killing it if it doesn't exit."""
+    proc.terminate()
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=5)
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+
+@pytest.fixture(scope="session")
+async def openfga_server(
+    openfga_data_dir, project_root_path, openfga_socket_path, e2e_maasdb
+):
+    """Start the OpenFGA server once for the whole session."""
     binary_path = project_root_path / "src/maasopenfga/build/maas-openfga"
 
     # Set the environment variable for the OpenFGA server to use the socket path in the temporary directory
     env = os.environ.copy()
     env["MAAS_OPENFGA_HTTP_SOCKET_PATH"] = str(openfga_socket_path)
 
-    regiond_conf = {
-        "database_host": db.config.host,
-        "database_name": db.config.name,
-        "database_user": "ubuntu",
-    }
-
     # Write the regiond configuration to a file in the temporary directory
-    with open(tmpdir / "regiond.conf", "w") as f:
-        f.write(yaml.dump(regiond_conf))
+    (openfga_data_dir / "regiond.conf").write_text(
+        f"database_host: {abspath('db/')}\n"
+        f"database_name: {e2e_maasdb}\n"
+        "database_user: ubuntu\n"
+    )
 
-    env["SNAP_DATA"] = str(tmpdir)
+    env["SNAP_DATA"] = str(openfga_data_dir)
 
-    pid = subprocess.Popen(binary_path, env=env)
+    proc = await asyncio.create_subprocess_exec(str(binary_path), env=env)
 
     timeout = timedelta(seconds=30)
-    start_time = time.monotonic()
-    while True:
-        if time.monotonic() - start_time > timeout.total_seconds():
-            pid.terminate()
-            raise TimeoutError(
-                "OpenFGA server did not start within the expected time."
-            )
-        if not openfga_socket_path.exists():
-            time.sleep(0.5)
-        else:
-            break
-    yield pid
-    pid.terminate()
+    try:
+        await asyncio.wait_for(
+            _wait_for_socket(openfga_socket_path),
+            timeout=timeout.total_seconds(),
+        )
+    except TimeoutError as e:
+        await _stop_process(proc)
+        raise TimeoutError(
+            "OpenFGA server did not start within the expected time."
+        ) from e
+    yield proc
+    await _stop_process(proc)
+
+
+@pytest.fixture
+async def openfga_client(
+    openfga_server, openfga_socket_path
+) -> AsyncIterator[OpenFGAClient]:
+    async with OpenFGAClient(str(openfga_socket_path)) as client:
+        yield client
@@ -2,13 +2,68 @@
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
 import pytest
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 from maascommon.openfga.async_client import OpenFGAClient
 from maasservicelayer.builders.openfga_tuple import OpenFGATupleBuilder
-from maasservicelayer.context import Context
-from maasservicelayer.services import CacheForServices, ServiceCollectionV3
+from maasservicelayer.services import ServiceCollectionV3
 from tests.e2e.env import skip_if_integration_disabled
 
+POOL_RELATIONS = (
+    "can_edit_machines",
+    "can_view_machines",
+    "can_view_available_machines",
+    "can_deploy_machines",
+)
+GLOBAL_RELATIONS = (
+    "can_edit_machines",
+    "can_edit_global_entities",
+    "can_view_global_entities",
+    "can_edit_controllers",
+    "can_view_controllers",
+    "can_edit_identities",
+    "can_view_identities",
+    "can_edit_configurations",
+    "can_view_configurations",
+    "can_edit_notifications",
+    "can_view_notifications",
+    "can_edit_boot_entities",
+    "can_view_boot_entities",
+    "can_view_license_keys",
+    "can_edit_license_keys",
+    "can_view_devices",
+)
+MAAS = OpenFGAClient.MAAS_GLOBAL_OBJ
+
+# (user_id, relation, object, expected result)
+CHECKS = [
+    # user 1000 should have all permissions on all the pools because of group 1000's system rights
+    *(
+        (1000, relation, f"pool:{i}", True)
+        for i in range(0, 3)
+        for relation in POOL_RELATIONS
+    ),
+    *((1000, relation, MAAS, True) for relation in GLOBAL_RELATIONS),
+    # user 2000 should just have edit,view and deploy permissions on pool0 because of group 2000's rights
+    *((2000, relation, "pool:0", True) for relation in POOL_RELATIONS),
+    *(
+        (2000, relation, f"pool:{i}", False)
+        for i in range(1, 3)
+        for relation in POOL_RELATIONS
+    ),
+    *((2000, relation, MAAS, False) for relation in GLOBAL_RELATIONS),
+    # user 3000 should just have deploy permissions on pool0 because of group 3000's rights
+    (3000, "can_edit_machines", "pool:0", False),
+    (3000, "can_view_machines", "pool:0", False),
+    (3000, "can_view_available_machines", "pool:0", False),
+    (3000, "can_deploy_machines", "pool:0", True),
+    # user 4000 should just view permissions on pool0 because of group 4000's rights
+    (4000, "can_edit_machines", "pool:0", False),
+    (4000, "can_view_machines", "pool:0", False),
+    (4000, "can_view_available_machines", "pool:0", True),
+    (4000, "can_deploy_machines", "pool:0", False),
+]
+
 
 @pytest.mark.asyncio
 @skip_if_integration_disabled()
@@ -16,227 +71,88 @@ class TestIntegrationConfigurationsService:
     @pytest.mark.allow_transactions
     @pytest.mark.usefixtures("db_connection")
     async def test_get(
-        self, openfga_server, openfga_socket_path, db_connection, db
+        self,
+        openfga_client: OpenFGAClient,
+        db_connection: AsyncConnection,
+        services: ServiceCollectionV3,
     ):
-        services = await ServiceCollectionV3.produce(
-            Context(connection=db_connection), cache=CacheForServices()
-        )
-
-        # Create pool:1, pool:2 and pool:3. pool:1 is the default and already exists
-        for i in range(1, 4):
-            await services.openfga_tuples.upsert(
-                OpenFGATupleBuilder.build_pool(str(i))
-            )
-
-        # group 1000 can edit and view everything
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_machines(group_id=1000)
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_global_entities(
-                group_id=1000
-            )
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_controllers(group_id=1000)
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_identities(group_id=1000)
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_configurations(
-                group_id=1000
-            )
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_boot_entities(
-                group_id=1000
-            )
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_notifications(
-                group_id=1000
-            )
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_license_keys(
-                group_id=1000
-            )
-        )
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_view_devices(group_id=1000)
-        )
-
-        # user 1000 belongs to group 1000
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_user_member_group(
-                user_id=1000, group_id=1000
-            )
-        )
-
-        # group 2000 can_edit_machines and can_view_machines in pool:0
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_edit_machines_in_pool(
-                group_id=2000, pool_id="0"
-            )
-        )
-        # user 2000 belongs to group 2000
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_user_member_group(
-                user_id=2000, group_id=2000
-            )
-        )
-
-        # group 3000 can_view_machines in pool:0
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_deploy_machines_in_pool(
-                group_id=3000, pool_id="0"
-            )
-        )
-        # user 3000 belongs to group 3000
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_user_member_group(
-                user_id=3000, group_id=3000
-            )
-        )
-
-        # group 4000 can_view_machines in pool:0
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_group_can_view_available_machines_in_pool(
-                group_id=4000, pool_id="0"
-            )
-        )
-        # user 4000 belongs to group 4000
-        await services.openfga_tuples.upsert(
-            OpenFGATupleBuilder.build_user_member_group(
-                user_id=4000, group_id=4000
-            )
+        await services.openfga_tuples.upsert_many(
+            [
+                # Create pool:1, pool:2 and pool:3. pool:1 is the default and already exists
+                *(OpenFGATupleBuilder.build_pool(str(i)) for i in range(1, 4)),
+                # group 1000 can edit and view everything
+                OpenFGATupleBuilder.build_group_can_edit_machines(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_edit_global_entities(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_edit_controllers(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_edit_identities(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_edit_configurations(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_edit_boot_entities(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_edit_notifications(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_edit_license_keys(
+                    group_id=1000
+                ),
+                OpenFGATupleBuilder.build_group_can_view_devices(
+                    group_id=1000
+                ),
+                # user 1000 belongs to group 1000
+                OpenFGATupleBuilder.build_user_member_group(
+                    user_id=1000, group_id=1000
+                ),
+                # group 2000 can_edit_machines and can_view_machines in pool:0
+                OpenFGATupleBuilder.build_group_can_edit_machines_in_pool(
+                    group_id=2000, pool_id="0"
+                ),
+                # user 2000 belongs to group 2000
+                OpenFGATupleBuilder.build_user_member_group(
+                    user_id=2000, group_id=2000
+                ),
+                # group 3000 can_view_machines in pool:0
+                OpenFGATupleBuilder.build_group_can_deploy_machines_in_pool(
+                    group_id=3000, pool_id="0"
+                ),
+                # user 3000 belongs to group 3000
+                OpenFGATupleBuilder.build_user_member_group(
+                    user_id=3000, group_id=3000
+                ),
+                # group 4000 can_view_machines in pool:0
+                OpenFGATupleBuilder.build_group_can_view_available_machines_in_pool(
+                    group_id=4000, pool_id="0"
+                ),
+                # user 4000 belongs to group 4000
+                OpenFGATupleBuilder.build_user_member_group(
+                    user_id=4000, group_id=4000
+                ),
+            ]
         )
 
         await db_connection.commit()
 
-        client = OpenFGAClient(str(openfga_socket_path))
-        # user 1000 should have all permissions on pool1 because of group 1000's system rights
-        for i in range(0, 3):
-            assert (
-                await client.can_edit_machines_in_pool(
-                    user_id=1000, pool_id=str(i)
-                )
-            ) is True
-            assert (
-                await client.can_view_machines_in_pool(
-                    user_id=1000, pool_id=str(i)
-                )
-            ) is True
-            assert (
-                await client.can_view_available_machines_in_pool(
-                    user_id=1000, pool_id=str(i)
-                )
-            ) is True
-            assert (
-                await client.can_deploy_machines_in_pool(
-                    user_id=1000, pool_id=str(i)
-                )
-            ) is True
-
-        assert (await client.can_edit_machines(user_id=1000)) is True
-        assert (await client.can_edit_global_entities(user_id=1000)) is True
-        assert (await client.can_view_global_entities(user_id=1000)) is True
-        assert (await client.can_edit_controllers(user_id=1000)) is True
-        assert (await client.can_view_controllers(user_id=1000)) is True
-        assert (await client.can_edit_identities(user_id=1000)) is True
-        assert (await client.can_view_identities(user_id=1000)) is True
-        assert (await client.can_edit_configurations(user_id=1000)) is True
-        assert (await client.can_view_configurations(user_id=1000)) is True
-        assert (await client.can_edit_notifications(user_id=1000)) is True
-        assert (await client.can_view_notifications(user_id=1000)) is True
-        assert (await client.can_edit_boot_entities(user_id=1000)) is True
-        assert (await client.can_view_boot_entities(user_id=1000)) is True
-        assert (await client.can_view_license_keys(user_id=1000)) is True
-        assert (await client.can_edit_license_keys(user_id=1000)) is True
-        assert (await client.can_view_devices(user_id=1000)) is True
-
-        # user 2000 should just have edit,view and deploy permissions on pool1 because of group 2000's rights
-        assert (
-            await client.can_edit_machines_in_pool(user_id=2000, pool_id="0")
-        ) is True
-        assert (
-            await client.can_view_machines_in_pool(user_id=2000, pool_id="0")
-        ) is True
-        assert (
-            await client.can_view_available_machines_in_pool(
-                user_id=2000, pool_id="0"
-            )
-        ) is True
-        assert (
-            await client.can_deploy_machines_in_pool(user_id=2000, pool_id="0")
-        ) is True
-
-        for i in range(1, 3):
-            assert (
-                await client.can_edit_machines_in_pool(
-                    user_id=2000, pool_id=str(i)
-                )
-            ) is False
-            assert (
-                await client.can_view_machines_in_pool(
-                    user_id=2000, pool_id=str(i)
-                )
-            ) is False
-            assert (
-                await client.can_view_available_machines_in_pool(
-                    user_id=2000, pool_id=str(i)
-                )
-            ) is False
-            assert (
-                await client.can_deploy_machines_in_pool(
-                    user_id=2000, pool_id=str(i)
-                )
-            ) is False
-
-        assert (await client.can_edit_machines(user_id=2000)) is False
-        assert (await client.can_view_global_entities(user_id=2000)) is False
-        assert (await client.can_edit_global_entities(user_id=2000)) is False
-        assert (await client.can_edit_identities(user_id=2000)) is False
-        assert (await client.can_view_identities(user_id=2000)) is False
-        assert (await client.can_edit_configurations(user_id=2000)) is False
-        assert (await client.can_view_configurations(user_id=2000)) is False
-        assert (await client.can_view_notifications(user_id=2000)) is False
-        assert (await client.can_edit_notifications(user_id=2000)) is False
-        assert (await client.can_view_boot_entities(user_id=2000)) is False
-        assert (await client.can_edit_boot_entities(user_id=2000)) is False
-        assert (await client.can_view_license_keys(user_id=2000)) is False
-        assert (await client.can_edit_license_keys(user_id=2000)) is False
-        assert (await client.can_view_devices(user_id=2000)) is False
-
-        # user 3000 should just have deploy permissions on pool0 because of group 3000's rights
-        assert (
-            await client.can_edit_machines_in_pool(user_id=3000, pool_id="0")
-        ) is False
-        assert (
-            await client.can_view_machines_in_pool(user_id=3000, pool_id="0")
-        ) is False
-        assert (
-            await client.can_view_available_machines_in_pool(
-                user_id=3000, pool_id="0"
-            )
-        ) is False
-        assert (
-            await client.can_deploy_machines_in_pool(user_id=3000, pool_id="0")
-        ) is True
-
-        # user 4000 should just view permissions on pool0 because of group 4000's rights
-        assert (
-            await client.can_edit_machines_in_pool(user_id=4000, pool_id="0")
-        ) is False
-        assert (
-            await client.can_view_machines_in_pool(user_id=4000, pool_id="0")
-        ) is False
-        assert (
-            await client.can_view_available_machines_in_pool(
-                user_id=4000, pool_id="0"
-            )
-        ) is True
-        assert (
-            await client.can_deploy_machines_in_pool(user_id=4000, pool_id="0")
-        ) is False
+        results = await openfga_client.batch_check(
+            [(user_id, relation, obj) for user_id, relation, obj, _ in CHECKS]
+        )
+        failed = [
+            check
+            for check, allowed in zip(CHECKS, results, strict=True)
+            if allowed is not check[3]
+        ]
+        assert failed == []
+
+        # The single check endpoint is still used by the can_* methods.
+        assert await openfga_client.can_edit_machines_in_pool(2000, 0)
+        assert await openfga_client.can_deploy_machines_in_pool(3000, 0)
+        assert not await openfga_client.can_edit_machines_in_pool(3000, 0)
+        assert not await openfga_client.can_view_global_entities(2000)
@@ -2,6 +2,7 @@
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
 from datetime import datetime, timezone
+from uuid import uuid4
 
 from maasservicelayer.db.tables import AgentTable
 from maasservicelayer.models.agents import Agent
@@ -30,3 +31,23 @@ async def create_test_agents_entry(
     [created_agent] = await fixture.create(AgentTable.name, agent)
 
     return Agent(**created_agent)
+
+
+async def create_n_test_agents_entries(
+    fixture: Fixture, rack_ids: list[int], rackcontroller_ids: list[int]
+) -> list[Agent]:
+    now = datetime.now(timezone.utc).astimezone()
+    all_agents = [
+        {
+            "created": now,
+            "updated": now,
+            "uuid": str(uuid4()),
+            "rack_id": rack_id,
+            "rackcontroller_id": rackcontroller_id,
+        }
+        for rack_id, rackcontroller_id in zip(
+            rack_ids, rackcontroller_ids, strict=True
+        )
+    ]
+    created_agents = await fixture.create(AgentTable.name, all_agents)
+    return [Agent(**created_agent) for created_agent in created_agents]
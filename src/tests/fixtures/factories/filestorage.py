@@ -5,19 +5,39 @@ from base64 import b64encode
 from maasservicelayer.models.filestorage import FileStorage
 from tests.maasapiserver.fixtures.db import Fixture
 
+# `content`'s type is `bytes` in service layer, base64-encoded `str` in db
+_DEFAULT_CONTENT_B64 = b64encode(b"content").decode("utf-8")
+
 
 async def create_test_filestorage_entry(
     fixture: Fixture, **extra_details
 ) -> FileStorage:
     filestorage = {
         "filename": "test_file",
-        # `content`'s type is `bytes` in service layer, base64-encoded `str` in db
-        "content": b64encode(b"content").decode("utf-8"),
+        "content": _DEFAULT_CONTENT_B64,
         "key": "key",
         "owner_id": None,
+        **extra_details,
     }
-    filestorage.update(extra_details)
     [created_filestorage] = await fixture.create(
         "maasserver_filestorage", [filestorage]
     )
     return FileStorage(**created_filestorage)
+
+
+async def create_n_test_filestorage_entries(
+    fixture: Fixture, size: int
+) -> list[FileStorage]:
+    all_filestorage = [
+        {
+            "filename": f"filename-{i}",
+            "content": b64encode(f"content-{i}".encode()).decode(),
+            "key": f"key-{i}",
+            "owner_id": None,
+        }
+        for i in range(size)
+    ]
+    created_filestorage = await fixture.create(
+        "maasserver_filestorage", all_filestorage
+    )
+    return [FileStorage(**filestorage) for filestorage in created_filestorage]
@@ -2,6 +2,8 @@
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
 
+from datetime import datetime
+from ipaddress import IPv4Address
 from typing import Any
 
 from maasservicelayer.models.mdns import MDNS
@@ -9,23 +11,50 @@ from maasservicelayer.utils.date import utcnow
 from tests.maasapiserver.fixtures.db import Fixture
 
 
-async def create_test_mdns_entry(
-    fixture: Fixture,
+def _mdns_row(
     hostname: str,
     ip: str,
     interface_id: int,
-    **extra_details: Any,
-) -> MDNS:
-    now = utcnow()
-    mdns = {
+    now: datetime,
+    extra_details: dict[str, Any],
+) -> dict[str, Any]:
+    return {
         "hostname": hostname,
         "ip": ip,
         "interface_id": interface_id,
         "created": now,
         "updated": now,
         "count": 1,
+        **extra_details,
     }
-    mdns.update(extra_details)
 
+
+async def create_test_mdns_entry(
+    fixture: Fixture,
+    hostname: str,
+    ip: str,
+    interface_id: int,
+    **extra_details: Any,
+) -> MDNS:
+    mdns = _mdns_row(hostname, ip, interface_id, utcnow(), extra_details)
     [created_mdns] = await fixture.create("maasserver_mdns", [mdns])
     return MDNS(**created_mdns)
+
+
+async def create_n_test_mdns_entries(
+    fixture: Fixture,
+    size: int,
+    hostname: str,
+    interface_id: int,
+    **extra_details: Any,
+) -> list[MDNS]:
+    now = utcnow()
+    first_ip = IPv4Address("10.0.0.1")
+    all_mdns = [
+        _mdns_row(
+            hostname, str(first_ip + i), interface_id, now, extra_details
+        )
+        for i in range(size)
+    ]
+    created_mdns = await fixture.create("maasserver_mdns", all_mdns)
+    return [MDNS(**mdns) for mdns in created_mdns]
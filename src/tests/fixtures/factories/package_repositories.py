@@ -8,6 +8,20 @@ from maasservicelayer.models.package_repositories import PackageRepository
 from maasservicelayer.utils.date import utcnow
 from tests.maasapiserver.fixtures.db import Fixture
 
+_DEFAULTS = {
+    "name": "test-main",
+    "key": "test-key",
+    "url": "http://archive.ubuntu.com/ubuntu",
+    "distributions": [],
+    "components": set(),
+    "arches": set(),
+    "disabled_pockets": set(),
+    "disabled_components": set(),
+    "disable_sources": False,
+    "default": False,
+    "enabled": True,
+}
+
 
 async def create_test_package_repository(
     fixture: Fixture, **extra_details: Any
@@ -16,21 +30,33 @@ async def create_test_package_repository(
     package_repo = {
         "created": now,
         "updated": now,
-        "name": "test-main",
-        "key": "test-key",
-        "url": "http://archive.ubuntu.com/ubuntu",
-        "distributions": [],
-        "components": set(),
-        "arches": set(),
-        "disabled_pockets": set(),
-        "disabled_components": set(),
-        "disable_sources": False,
-        "default": False,
-        "enabled": True,
+        **_DEFAULTS,
+        **extra_details,
     }
-    package_repo.update(extra_details)
-
-    [package_repo] = await fixture.create(
+    [created_package_repo] = await fixture.create(
         PackageRepositoryTable.name, package_repo
     )
-    return PackageRepository(**package_repo)
+    return PackageRepository(**created_package_repo)
+
+
+async def create_n_test_package_repositories(
+    fixture: Fixture, size: int, **extra_details: Any
+) -> list[PackageRepository]:
+    now = utcnow()
+    all_package_repos = [
+        {
+            "created": now,
+            "updated": now,
+            **_DEFAULTS,
+            "name": f"test-{i}",
+            **extra_details,
+        }
+        for i in range(size)
+    ]
+    created_package_repos = await fixture.create(
+        PackageRepositoryTable.name, all_package_repos
+    )
+    return [
+        PackageRepository(**created_package_repo)
+        for created_package_repo in created_package_repos
+    ]
@@ -24,3 +24,15 @@ async def create_test_rack_entry(
     [created_rack] = await fixture.create(RackTable.name, rack)
 
     return Rack(**created_rack)
+
+
+async def create_n_test_rack_entries(
+    fixture: Fixture, size: int
+) -> list[Rack]:
+    now = datetime.now(timezone.utc).astimezone()
+    all_racks = [
+        {"created": now, "updated": now, "name": f"rack-{i}"}
+        for i in range(size)
+    ]
+    created_racks = await fixture.create(RackTable.name, all_racks)
+    return [Rack(**created_rack) for created_rack in created_racks]
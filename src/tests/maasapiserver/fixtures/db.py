@@ -98,6 +98,14 @@ class Fixture:
         table: str,
         data: dict[str, Any] | list[dict[str, Any]] | None = None,
     ) -> list[dict[str, Any]]:
+        """Insert the rows and return them as stored in the database.
+
+        A list of rows is sent as a single multi-row INSERT, so factories
+        seeding many rows should pass them all at once. An empty list
+        inserts nothing.
+        """
+        if isinstance(data, list) and not data:
+            return []
         result = await self.conn.execute(
             METADATA.tables[table].insert().returning("*"), data
         )
@@ -4,12 +4,25 @@
 import ast
 import inspect
 import textwrap
+from typing import Iterable, Iterator
 
 import uvicorn.protocols.http.h11_impl as h11_impl
 
 from maasapiserver.tls import TLSPatchedH11Protocol
 
 
+def _strip_patch(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the lines outside of the ### BEGIN/END PATCH markers."""
+    in_patch_block = False
+    for line in lines:
+        if "### BEGIN PATCH" in line:
+            in_patch_block = True
+        elif "### END PATCH" in line:
+            in_patch_block = False
+        elif not in_patch_block:
+            yield line
+
+
 class TestTLSPatchedH11Protocol:
     def test_handle_events_is_identical_except_patch(self):
         """
@@ -30,18 +43,7 @@ class TestTLSPatchedH11Protocol:
         original_src = textwrap.dedent(original_src)
         patched_src = textwrap.dedent(patched_src)
 
-        filtered_lines = []
-        in_patch_block = False
-        for line in patched_src.splitlines():
-            if "### BEGIN PATCH" in line:
-                in_patch_block = True
-                continue
-            elif "### END PATCH" in line:
-                in_patch_block = False
-                continue
-            if not in_patch_block:
-                filtered_lines.append(line)
-        patched_src_clean = "\n".join(filtered_lines)
+        patched_src_clean = "\n".join(_strip_patch(patched_src.splitlines()))
 
         original_ast = ast.parse(original_src)
         patched_ast = ast.parse(patched_src_clean)
@@ -2,8 +2,8 @@
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
 from datetime import timedelta
-from typing import Awaitable, Callable
-from unittest.mock import AsyncMock, Mock, patch
+from typing import Awaitable, Callable, Iterator
+from unittest.mock import AsyncMock, DEFAULT, Mock, patch
 
 from fastapi import FastAPI
 from httpx import AsyncClient
@@ -31,10 +31,11 @@ from maasservicelayer.services.racks import RacksService
 from maasservicelayer.services.secrets import SecretsService
 from maasservicelayer.utils.date import utcnow
 from provisioningserver.certificates import Certificate
+from tests.fixtures import get_test_data_file
 
 """
-Instructions to generate a Certificate Signing Request (CSR) with certain
-Common Name (CN)
+Instructions to generate the Certificate Signing Request (CSR) in
+tests/fixtures/test_data/agent_csr.pem with a certain Common Name (CN)
 
 # generate a private key
 $ openssl genrsa -out private.key 1024
@@ -48,20 +49,7 @@ $ cat request.csr
 # - inspect the decode CSR and verify CN
 $ openssl req -in request.csr -noout -text
 """
-CSR = "\n".join(
-    [
-        "-----BEGIN CERTIFICATE REQUEST-----",
-        "MIIBbjCB2AIBADAvMS0wKwYDVQQDDCQwMWYwOWQzMi1mNTA4LTYwNjQtYmQxYy1j",
-        "MDI1YTU4ZGQwNjgwgZ8wDQYJKoZIhvcNAQEBBQADgY0AMIGJAoGBAKuwhG8GrttS",
-        "Jn8IFtagVM9b0e6OIor+mt00hSz9sf/U+q03QpDXVhkumU4EoJlU8EFqCANMClwX",
-        "pmEI4xmRjr8DUgIP7zuTu8wacaQCoHMWvxg8sTb66G3FaD0tDqo4S6/31Ea4LDZ4",
-        "ycdn2/cT9BLCdNazt/NxAdWAeYtB4ASHAgMBAAGgADANBgkqhkiG9w0BAQsFAAOB",
-        "gQB06a8a64WR3qZL1j1Q1jWVK1/d189s0jY0zW6DUlNdaPBSMD67asbqDB6uCacD",
-        "on1EEkebWMQG3uLsXE37/t9a7rRvRIAqD+L45ukfbzgjZ1LQmDYSWLhWuTzgfm69",
-        "KvJsHcrkPdJ2ETV9zhvIqBWasyhRYzjn0bOQ/jIuiMItyw==",
-        "-----END CERTIFICATE REQUEST-----",
-    ]
-)
+CSR = get_test_data_file("agent_csr.pem")
 UUID = "01f09d32-f508-6064-bd1c-c025a58dd068"
 
 
@@ -81,12 +69,46 @@ class InjectFakeTLSCN(BaseHTTPMiddleware):
 @pytest.mark.asyncio
 class TestAgentsApi:
     BASE_PATH = f"{V3_INTERNAL_API_PREFIX}/agents"
+    VALID_UNTIL = utcnow() + timedelta(days=1)
+    EXPIRED_AT = utcnow() - timedelta(days=1)
 
     @pytest.fixture
     def internal_api_headers(self) -> dict:
         """Returns headers required for internal API requests"""
         return {"client-cert-cn": "test-client"}
 
+    @pytest.fixture
+    def post_enroll(
+        self,
+        mocked_internal_api_client: AsyncClient,
+        internal_api_headers: dict,
+    ) -> Callable[[str], Awaitable[Response]]:
+        async def post(secret: str) -> Response:
+            return await mocked_internal_api_client.post(
+                f"{self.BASE_PATH}:enroll",
+                json={"secret": secret, "csr": CSR},
+                headers=internal_api_headers,
+            )
+
+        return post
+
+    @pytest.fixture
+    def enrollment_mocks(self) -> Iterator[dict[str, Mock]]:
+        fetch_maas_ca_cert = AsyncMock()
+        with (
+            patch.multiple(
+                "maasapiserver.v3.api.internal.handlers.agent",
+                sign_certificate_request=DEFAULT,
+                fetch_maas_ca_cert=fetch_maas_ca_cert,
+            ) as mocks,
+            patch.object(crypto, "dump_certificate") as dump_certificate,
+        ):
+            yield {
+                **mocks,
+                "fetch_maas_ca_cert": fetch_maas_ca_cert,
+                "dump_certificate": dump_certificate,
+            }
+
     async def test_agent_config_200_without_system_id(
         self,
         services_mock: ServiceCollectionV3,
@@ -222,25 +244,17 @@ class TestAgentsApi:
             == "RPC secret is not configured. Please ensure MAAS is properly initialized."
         )
 
-    @patch(
-        "maasapiserver.v3.api.internal.handlers.agent.sign_certificate_request"
-    )
-    @patch(
-        "maasapiserver.v3.api.internal.handlers.agent.fetch_maas_ca_cert",
-        new_callable=AsyncMock,
-    )
-    @patch(
-        "maasapiserver.v3.api.internal.handlers.agent.crypto.dump_certificate",
-    )
     async def test_agent_enrollment_success(
         self,
-        mock_dump_certificate,
-        mock_fetch_maas_ca_cert,
-        mock_sign_certificate_request,
+        enrollment_mocks: dict[str, Mock],
         services_mock: ServiceCollectionV3,
-        mocked_internal_api_client: AsyncClient,
-        internal_api_headers: dict,
+        post_enroll: Callable[[str], Awaitable[Response]],
     ) -> None:
+        mock_dump_certificate = enrollment_mocks["dump_certificate"]
+        mock_fetch_maas_ca_cert = enrollment_mocks["fetch_maas_ca_cert"]
+        mock_sign_certificate_request = enrollment_mocks[
+            "sign_certificate_request"
+        ]
         mock_dump_certificate.side_effect = [
             b"signed_cert_pem_bytes",
             b"ca_cert_pem_bytes",
@@ -263,7 +277,7 @@ class TestAgentsApi:
             id=1,
             secret="test-secret",
             rack_id=1,
-            expires_at=utcnow() + timedelta(minutes=5),
+            expires_at=self.VALID_UNTIL,
         )
         services_mock.bootstraptokens.get_one.return_value = mock_token
         services_mock.racks = Mock(RacksService)
@@ -282,12 +296,7 @@ class TestAgentsApi:
         mock_agent = Agent(id=1, uuid=UUID, rack_id=1)
         services_mock.agents.create.return_value = mock_agent
 
-        request_data = {"secret": "test-secret", "csr": CSR}
-        response = await mocked_internal_api_client.post(
-            f"{self.BASE_PATH}:enroll",
-            json=request_data,
-            headers=internal_api_headers,
-        )
+        response = await post_enroll("test-secret")
         assert response.status_code == 201
         response_json = response.json()
         assert "certificate" in response_json
@@ -299,55 +308,30 @@ class TestAgentsApi:
         assert mock_dump_certificate.call_count == 2
         services_mock.bootstraptokens.delete_one.assert_called_once()
 
-    async def test_agent_enrollment_failed_with_not_found_secret(
-        self,
-        services_mock: ServiceCollectionV3,
-        mocked_internal_api_client: AsyncClient,
-        internal_api_headers: dict,
-    ) -> None:
-        services_mock.bootstraptokens = Mock(BootstrapTokensService)
-        services_mock.bootstraptokens.get_one.return_value = None
-
-        request_data = {"secret": "invalid-secret", "csr": CSR}
-
-        response = await mocked_internal_api_client.post(
-            f"{self.BASE_PATH}:enroll",
-            json=request_data,
-            headers=internal_api_headers,
-        )
-        assert response.status_code == 401
-        response_json = response.json()
-        assert (
-            response_json["details"][0]["type"] == INVALID_TOKEN_VIOLATION_TYPE
-        )
-        assert (
-            response_json["details"][0]["message"]
-            == "Bootstrap token invalid or expired."
-        )
-
-    async def test_agent_enrollment_with_expired_secret(
+    @pytest.mark.parametrize(
+        "token",
+        [
+            None,
+            BootstrapToken(
+                id=1,
+                secret="test-secret",
+                rack_id=1,
+                expires_at=EXPIRED_AT,
+            ),
+        ],
+        ids=["not_found", "expired"],
+    )
+    async def test_agent_enrollment_with_invalid_secret(
         self,
+        token: BootstrapToken | None,
         services_mock: ServiceCollectionV3,
-        mocked_internal_api_client: AsyncClient,
-        internal_api_headers: dict,
+        post_enroll: Callable[[str], Awaitable[Response]],
     ) -> None:
         services_mock.bootstraptokens = Mock(BootstrapTokensService)
-        mock_token = BootstrapToken(
-            id=1,
-            secret="test-secret",
-            rack_id=1,
-            expires_at=utcnow()
-            - timedelta(minutes=5),  # expired 5 minutes ago
-        )
-        services_mock.bootstraptokens.get_one.return_value = mock_token
+        services_mock.bootstraptokens.get_one.return_value = token
 
-        request_data = {"secret": "test-secret", "csr": CSR}
+        response = await post_enroll("test-secret")
 
-        response = await mocked_internal_api_client.post(
-            f"{self.BASE_PATH}:enroll",
-            json=request_data,
-            headers=internal_api_headers,
-        )
         assert response.status_code == 401
         response_json = response.json()
         assert (
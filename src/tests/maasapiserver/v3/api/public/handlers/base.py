@@ -3,11 +3,22 @@
 
 import abc
 from dataclasses import dataclass
+from io import BytesIO
 
 from httpx import AsyncClient
 import pytest
 
 
+def create_dummy_binary_upload_file(
+    name: str | None = "test_upload_file.bin",
+    size_in_bytes: int = 1024,
+) -> BytesIO:
+    assert size_in_bytes >= 0, "Size of dummy file must be positive"
+    file_bytes = BytesIO(b"0" * size_in_bytes)
+    file_bytes.name = name
+    return file_bytes
+
+
 @dataclass
 class Endpoint:
     method: str
@@ -2,7 +2,6 @@
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
 import hashlib
-from io import BytesIO
 from unittest.mock import MagicMock, Mock, patch
 
 from aiofiles.threadpool.binary import AsyncBufferedIOBase
@@ -74,6 +73,7 @@ from maastesting.factory import factory
 from tests.fixtures import AsyncContextManagerMock
 from tests.maasapiserver.v3.api.public.handlers.base import (
     ApiCommonTests,
+    create_dummy_binary_upload_file,
     Endpoint,
 )
 
@@ -169,18 +169,6 @@ class TestCustomImagesApi(ApiCommonTests):
             Endpoint(method="DELETE", path=f"{self.BASE_PATH}/1"),
         ]
 
-    def create_dummy_binary_upload_file(
-        self,
-        name: str | None = "test_upload_file.bin",
-        size_in_bytes: int = 1024,
-    ) -> BytesIO:
-        assert size_in_bytes >= 0, "Size of dummy file must be positive"
-        file_bytes = BytesIO()
-        file_bytes.name = name
-        file_bytes.write(b"0" * size_in_bytes)
-        file_bytes.seek(0)
-        return file_bytes
-
     @patch("maasapiserver.v3.api.public.handlers.boot_resources.MAAS_ID")
     @patch(
         "maasservicelayer.utils.image_local_files.AsyncLocalBootResourceFile"
@@ -198,7 +186,7 @@ class TestCustomImagesApi(ApiCommonTests):
     ) -> None:
         file_name = "test.bin"
         file_size = 1024
-        file_data = self.create_dummy_binary_upload_file(
+        file_data = create_dummy_binary_upload_file(
             name=file_name, size_in_bytes=file_size
         )
 
@@ -316,7 +304,7 @@ class TestCustomImagesApi(ApiCommonTests):
     ) -> None:
         file_name = "test.bin"
         file_size = 1024
-        file_data = self.create_dummy_binary_upload_file(
+        file_data = create_dummy_binary_upload_file(
             name=file_name, size_in_bytes=file_size
         )
 
@@ -287,7 +287,7 @@ class TestFabricsApi(ApiCommonTests):
         services_mock.fabrics.update_by_id.return_value = updated_fabric
 
         response = await mocked_api_client_admin.put(
-            f"{self.BASE_PATH}/{str(TEST_FABRIC.id)}",
+            f"{self.BASE_PATH}/{TEST_FABRIC.id}",
             json=jsonable_encoder(update_fabric_request),
         )
 
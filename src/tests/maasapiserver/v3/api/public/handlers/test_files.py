@@ -1,7 +1,6 @@
 #  Copyright 2025 Canonical Ltd.  This software is licensed under the
 #  GNU Affero General Public License version 3 (see the file LICENSE).
 from base64 import b64encode
-from io import BytesIO
 from typing import List
 from unittest.mock import ANY, AsyncMock, Mock
 
@@ -29,6 +28,7 @@ from maasservicelayer.models.filestorage import FileStorage
 from maasservicelayer.services import FileStorageService, ServiceCollectionV3
 from tests.maasapiserver.v3.api.public.handlers.base import (
     ApiCommonTests,
+    create_dummy_binary_upload_file,
     Endpoint,
 )
 
@@ -68,18 +68,6 @@ class TestFilesApi(ApiCommonTests):
     def admin_endpoints(self) -> List[Endpoint]:
         return []
 
-    def create_dummy_binary_upload_file(
-        self,
-        name: str | None = "test_upload_file.bin",
-        size_in_bytes: int = 1024,
-    ) -> BytesIO:
-        assert size_in_bytes >= 0, "Size of dummy file must be positive"
-        file_bytes = BytesIO()
-        file_bytes.name = name
-        file_bytes.write(b"0" * size_in_bytes)
-        file_bytes.seek(0)
-        return file_bytes
-
     async def test_list_files(
         self,
         services_mock: ServiceCollectionV3,
@@ -250,7 +238,7 @@ class TestFilesApi(ApiCommonTests):
         mocked_api_client_user: AsyncClient,
     ) -> None:
         file_name = "test.bin"
-        file_data = self.create_dummy_binary_upload_file(file_name)
+        file_data = create_dummy_binary_upload_file(file_name)
 
         file_to_return = FileStorage(
             id=0,
@@ -293,7 +281,7 @@ class TestFilesApi(ApiCommonTests):
         mocked_api_client_user: AsyncClient,
     ) -> None:
         file_name = "this/is/a/test.bin"
-        file_data = self.create_dummy_binary_upload_file(file_name)
+        file_data = create_dummy_binary_upload_file(file_name)
 
         file_to_return = FileStorage(
             id=0,
@@ -336,7 +324,7 @@ class TestFilesApi(ApiCommonTests):
         mocked_api_client_user: AsyncClient,
     ) -> None:
         file_name = "test.bin"
-        file_data = self.create_dummy_binary_upload_file(file_name)
+        file_data = create_dummy_binary_upload_file(file_name)
 
         file_to_return = FileStorage(
             id=0,
@@ -379,7 +367,7 @@ class TestFilesApi(ApiCommonTests):
         mocked_api_client_user: AsyncClient,
     ) -> None:
         file_name = "test.bin"
-        file_data = self.create_dummy_binary_upload_file(
+        file_data = create_dummy_binary_upload_file(
             name=file_name, size_in_bytes=0
         )
 
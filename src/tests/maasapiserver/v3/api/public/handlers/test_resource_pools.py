@@ -406,7 +406,7 @@ class TestResourcePoolApi(ApiCommonTests):
             name="newname", description="new description"
         )
         response = await mocked_api_client_admin.put(
-            f"{self.BASE_PATH}/{str(TEST_RESOURCE_POOL.id)}",
+            f"{self.BASE_PATH}/{TEST_RESOURCE_POOL.id}",
             json=jsonable_encoder(update_resource_pool_request),
         )
         assert response.status_code == 200
@@ -502,7 +502,7 @@ class TestResourcePoolApi(ApiCommonTests):
             name="newname", description="new description"
         )
         response = await mocked_api_client_admin_rbac.put(
-            f"{self.BASE_PATH}/{str(TEST_RESOURCE_POOL.id)}",
+            f"{self.BASE_PATH}/{TEST_RESOURCE_POOL.id}",
             json=jsonable_encoder(update_resource_pool_request),
         )
 
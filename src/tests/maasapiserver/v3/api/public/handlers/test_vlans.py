@@ -266,7 +266,7 @@ class TestVlanApi(ApiCommonTests):
             fabric_id=TEST_VLAN.fabric_id,
         )
         response = await mocked_api_client_admin.put(
-            f"{self.BASE_PATH}/{str(TEST_VLAN.id)}",
+            f"{self.BASE_PATH}/{TEST_VLAN.id}",
             json=jsonable_encoder(update_vlan_request),
         )
         assert response.status_code == 200
@@ -292,7 +292,7 @@ class TestVlanApi(ApiCommonTests):
             relay_vlan_id=1,
         )
         response = await mocked_api_client_admin.put(
-            f"{self.BASE_PATH}/{str(TEST_VLAN.id)}",
+            f"{self.BASE_PATH}/{TEST_VLAN.id}",
             json=jsonable_encoder(update_vlan_request),
         )
         assert response.status_code == 422
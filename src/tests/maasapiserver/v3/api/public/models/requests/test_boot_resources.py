@@ -1,6 +1,6 @@
 #  Copyright 2025 Canonical Ltd.  This software is licensed under the
 #  GNU Affero General Public License version 3 (see the file LICENSE).
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -21,7 +21,13 @@ from maasservicelayer.services import ServiceCollectionV3
 from maasservicelayer.services.bootresources import BootResourceService
 from maasservicelayer.services.bootsourcecache import BootSourceCacheService
 from maasservicelayer.services.configurations import ConfigurationsService
-from maastesting.factory import factory
+
+CACHED_OS_RELEASES = [
+    BootSourceCacheOSRelease(os="ubuntu", release="noble"),
+    BootSourceCacheOSRelease(os="ubuntu", release="focal"),
+    BootSourceCacheOSRelease(os="ubuntu", release="jammy"),
+    BootSourceCacheOSRelease(os="centos", release="8"),
+]
 
 
 @pytest.fixture
@@ -33,23 +39,10 @@ def mock_services():
     return services_mock
 
 
+# None of the tests need a loop of their own, so they share one per class.
+@pytest.mark.asyncio(scope="class")
 class TestBootResourceCreateRequest:
-    @patch(
-        "maasapiserver.v3.api.public.models.requests.boot_resources.BootResourceCreateRequest._validate_architecture"
-    )
-    @patch(
-        "maasapiserver.v3.api.public.models.requests.boot_resources.BootResourceCreateRequest._validate_base_image"
-    )
-    @patch(
-        "maasapiserver.v3.api.public.models.requests.boot_resources.BootResourceCreateRequest._validate_name"
-    )
-    async def test_to_builder(
-        self,
-        validate_name_mock: MagicMock,
-        validate_base_image_mock: MagicMock,
-        validate_architecture_mock: MagicMock,
-        mock_services,
-    ):
+    async def test_to_builder(self, mock_services):
         request = BootResourceCreateRequest(
             name="test-name",
             sha256="test-sha256",
@@ -59,13 +52,17 @@ class TestBootResourceCreateRequest:
             title=None,
         )
 
-        validate_name_mock.return_value = request.name
-        validate_base_image_mock.return_value = request.base_image
-        validate_architecture_mock.return_value = request.architecture
-
-        resource_builder: BootResourceBuilder = await request.to_builder(
-            services=mock_services
-        )
+        with patch.multiple(
+            BootResourceCreateRequest,
+            _validate_name=AsyncMock(return_value=request.name),
+            _validate_base_image=AsyncMock(return_value=request.base_image),
+            _validate_architecture=AsyncMock(
+                return_value=request.architecture
+            ),
+        ):
+            resource_builder: BootResourceBuilder = await request.to_builder(
+                services=mock_services
+            )
 
         assert resource_builder.name == request.name
         assert resource_builder.base_image == request.base_image
@@ -91,22 +88,20 @@ class TestBootResourceCreateRequest:
     async def test_validate_name_supported(self, name, mock_services):
         mock_services.boot_source_cache.get_unique_os_releases.return_value = []
 
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="a" * 64,
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
+        validated_name = await BootResourceCreateRequest._validate_name(
+            name, mock_services
         )
-        validated_name = await request._validate_name(name, mock_services)
 
         assert validated_name == name
 
     @pytest.mark.parametrize(
-        "name,reserved_releases",
+        "name,cached_releases,message",
         [
-            ("centos/8", [BootSourceCacheOSRelease(os="centos", release="8")]),
+            (
+                "centos/8",
+                [BootSourceCacheOSRelease(os="centos", release="8")],
+                "centos/8 is a reserved name",
+            ),
             (
                 "onie/mellanox-3.8.0",
                 [
@@ -114,141 +109,31 @@ class TestBootResourceCreateRequest:
                         os="onie", release="mellanox-3.8.0"
                     )
                 ],
+                "onie/mellanox-3.8.0 is a reserved name",
             ),
+            ("unsupported/os", [], "Unsupported operating system unsupported"),
+            ("centos7", [], "centos7 is a reserved name"),
+            ("ubuntu", CACHED_OS_RELEASES, "ubuntu is a reserved name"),
+            (
+                "ubuntu/my-ubuntu-release",
+                CACHED_OS_RELEASES,
+                "To upload an Ubuntu custom image you have to specify 'custom' as the OS",
+            ),
+            ("noble", CACHED_OS_RELEASES, "noble is a reserved name"),
         ],
     )
-    async def test_validate_name_fails_when_reserved(
-        self, name, reserved_releases, mock_services
+    async def test_validate_name_fails(
+        self, name, cached_releases, message, mock_services
     ):
         mock_services.boot_source_cache.get_unique_os_releases.return_value = (
-            reserved_releases
-        )
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="a" * 64,
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
-        )
-        with pytest.raises(ValidationException) as exc:
-            await request._validate_name(name, mock_services)
-
-        assert exc.value.details[0].field == "name"
-        assert "reserved" in exc.value.details[0].message.lower()
-
-    async def test_validate_name_fails_when_not_supported(self, mock_services):
-        mock_services.boot_source_cache.get_unique_os_releases.return_value = []
-
-        name = "unsupported/os"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
+            cached_releases
         )
-        with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_name(name, mock_services)
-
-        assert validation_exception.value.details[0].field == "name"
 
-    async def test_validate_name_fails_when_centos_name(self, mock_services):
-        mock_services.boot_source_cache.get_unique_os_releases.return_value = []
-
-        name = "centos7"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
-        )
         with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_name(name, mock_services)
-
-        assert validation_exception.value.details[0].field == "name"
-
-    async def test_validate_name_fails_when_reserved_osystem(
-        self, mock_services
-    ):
-        mock_services.boot_source_cache.get_unique_os_releases.return_value = [
-            BootSourceCacheOSRelease(os="ubuntu", release="noble"),
-            BootSourceCacheOSRelease(os="ubuntu", release="focal"),
-            BootSourceCacheOSRelease(os="ubuntu", release="jammy"),
-            BootSourceCacheOSRelease(os="centos", release="8"),
-        ]
-
-        name = "ubuntu"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
-        )
-        with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_name(name, mock_services)
-
-        assert validation_exception.value.details[0].field == "name"
-
-    async def test_validate_name_fails_if_os_is_ubuntu(self, mock_services):
-        mock_services.boot_source_cache.get_unique_os_releases.return_value = [
-            BootSourceCacheOSRelease(os="ubuntu", release="noble"),
-            BootSourceCacheOSRelease(os="ubuntu", release="focal"),
-            BootSourceCacheOSRelease(os="ubuntu", release="jammy"),
-            BootSourceCacheOSRelease(os="centos", release="8"),
-        ]
-
-        name = "ubuntu/my-ubuntu-release"
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
-        )
-        with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_name(name, mock_services)
-
-        assert validation_exception.value.details[0].field == "name"
-        assert (
-            validation_exception.value.details[0].message
-            == "To upload an Ubuntu custom image you have to specify 'custom' as the OS"
-        )
-
-    async def test_validate_name_fails_when_reserved_release(
-        self, mock_services
-    ):
-        mock_services.boot_source_cache.get_unique_os_releases.return_value = [
-            BootSourceCacheOSRelease(os="ubuntu", release="noble"),
-            BootSourceCacheOSRelease(os="ubuntu", release="focal"),
-            BootSourceCacheOSRelease(os="ubuntu", release="jammy"),
-            BootSourceCacheOSRelease(os="centos", release="8"),
-        ]
-
-        name = "noble"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
-        )
-        with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_name(name, mock_services)
+            await BootResourceCreateRequest._validate_name(name, mock_services)
 
         assert validation_exception.value.details[0].field == "name"
+        assert message in validation_exception.value.details[0].message
 
     async def test_validate_base_image_defaults_to_commissioning_release(
         self, mock_services
@@ -263,17 +148,10 @@ class TestBootResourceCreateRequest:
             "commissioning_distro_series": "noble",
         }
 
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture=architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=test_base_image,
-        )
-
-        validated_base_image = await request._validate_base_image(
-            test_base_image, name, architecture, mock_services
+        validated_base_image = (
+            await BootResourceCreateRequest._validate_base_image(
+                test_base_image, name, architecture, mock_services
+            )
         )
 
         assert validated_base_image == "ubuntu/noble"
@@ -288,20 +166,13 @@ class TestBootResourceCreateRequest:
         mock_services.boot_resources.get_one.return_value = None
 
         test_base_image = None
-        name = f"{os_name}/{factory.make_name()}"
+        name = f"{os_name}/my-image"
         architecture = "amd64/generic"
 
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="a" * 64,
-            architecture=architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=test_base_image,
-        )
-
-        validated_base_image = await request._validate_base_image(
-            test_base_image, name, architecture, mock_services
+        validated_base_image = (
+            await BootResourceCreateRequest._validate_base_image(
+                test_base_image, name, architecture, mock_services
+            )
         )
 
         assert validated_base_image == ""
@@ -311,16 +182,7 @@ class TestBootResourceCreateRequest:
     ):
         mock_services.boot_resources.get_one.return_value = None
 
-        request = BootResourceCreateRequest(
-            name="onie/mellanox-3.8.0",
-            sha256="a" * 64,
-            architecture="amd64/generic",
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image="ubuntu/focal",
-        )
-
-        validated = await request._validate_base_image(
+        validated = await BootResourceCreateRequest._validate_base_image(
             "ubuntu/focal",
             "onie/mellanox-3.8.0",
             "amd64/generic",
@@ -348,17 +210,10 @@ class TestBootResourceCreateRequest:
 
         mock_services.boot_resources.get_one.return_value = existing_resource
 
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture=architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=test_base_image,
-        )
-
-        validated_base_image = await request._validate_base_image(
-            test_base_image, name, architecture, mock_services
+        validated_base_image = (
+            await BootResourceCreateRequest._validate_base_image(
+                test_base_image, name, architecture, mock_services
+            )
         )
 
         assert validated_base_image == base_image
@@ -372,17 +227,8 @@ class TestBootResourceCreateRequest:
 
         mock_services.boot_resources.get_one.return_value = None
 
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture=architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=test_base_image,
-        )
-
         with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_base_image(
+            await BootResourceCreateRequest._validate_base_image(
                 test_base_image, name, architecture, mock_services
             )
 
@@ -397,17 +243,8 @@ class TestBootResourceCreateRequest:
 
         mock_services.boot_resources.get_one.return_value = None
 
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture=architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=test_base_image,
-        )
-
         with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_base_image(
+            await BootResourceCreateRequest._validate_base_image(
                 test_base_image, name, architecture, mock_services
             )
 
@@ -436,90 +273,44 @@ class TestBootResourceCreateRequest:
             "armhf/generic",
         ]
 
-        name = f"custom/{factory.make_name()}"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="a" * 64,
-            architecture=architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
-        )
-
-        validated_architecture = await request._validate_architecture(
-            architecture, mock_services
-        )
-
-        assert validated_architecture == architecture
-
-    async def test_validate_architecture_not_usable(self, mock_services):
-        mock_services.boot_resources.get_usable_architectures.return_value = [
-            "amd64/generic",
-        ]
-
-        test_architecture = "arm64/generic"
-        name = f"custom/{factory.make_name()}"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture=test_architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
-        )
-
-        with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_architecture(
-                test_architecture, mock_services
+        validated_architecture = (
+            await BootResourceCreateRequest._validate_architecture(
+                architecture, mock_services
             )
-
-        assert validation_exception.value.details[0].field == "architecture"
-
-    async def test_validate_architecture_invalid_format(self, mock_services):
-        test_architecture = "asdfghjkl;./"
-        name = f"custom/{factory.make_name()}"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture=test_architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
         )
 
-        with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_architecture(
-                test_architecture, mock_services
-            )
-
-        assert validation_exception.value.details[0].field == "architecture"
+        assert validated_architecture == architecture
 
-    async def test_validate_architecture_fails_if_no_usable_architectures(
-        self, mock_services
+    @pytest.mark.parametrize(
+        "architecture,usable_architectures,message",
+        [
+            (
+                "arm64/generic",
+                ["amd64/generic"],
+                "arm64/generic is not a valid usable architecture",
+            ),
+            ("asdfghjkl;./", [], "Not a valid architecture string"),
+            (
+                "amd64/generic",
+                [],
+                "amd64/generic is not a valid usable architecture",
+            ),
+        ],
+    )
+    async def test_validate_architecture_fails(
+        self, architecture, usable_architectures, message, mock_services
     ):
-        mock_services.boot_resources.get_usable_architectures.return_value = []
-
-        test_architecture = "amd64/generic"
-        name = f"custom/{factory.make_name()}"
-
-        request = BootResourceCreateRequest(
-            name=name,
-            sha256="test-sha256",
-            architecture=test_architecture,
-            file_type=BootResourceFileTypeChoice.TGZ,
-            title=None,
-            base_image=None,
+        mock_services.boot_resources.get_usable_architectures.return_value = (
+            usable_architectures
         )
 
         with pytest.raises(ValidationException) as validation_exception:
-            await request._validate_architecture(
-                test_architecture, mock_services
+            await BootResourceCreateRequest._validate_architecture(
+                architecture, mock_services
             )
 
         assert validation_exception.value.details[0].field == "architecture"
+        assert message in validation_exception.value.details[0].message
 
     @pytest.mark.parametrize(
         "file_type",
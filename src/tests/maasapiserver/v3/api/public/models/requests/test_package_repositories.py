@@ -10,6 +10,7 @@ from maasapiserver.v3.api.public.models.requests.package_repositories import (
 )
 from maascommon.enums.package_repositories import (
     ComponentsToDisableEnum,
+    KnownArchesEnum,
     KnownComponentsEnum,
     PACKAGE_REPO_MAIN_ARCHES,
     PACKAGE_REPO_PORTS_ARCHES,
@@ -17,24 +18,24 @@ from maascommon.enums.package_repositories import (
 from maasservicelayer.exceptions.catalog import ValidationException
 from maasservicelayer.models.fields import PackageRepoUrl
 
+# PackageRepoUrl is an immutable str, so the same validated URL is shared.
+PPA_URL = PackageRepoUrl("ppa:foo/bar")
 
-class TestPackageRepositoryCreateRequest:
-    @pytest.mark.parametrize("name", ["test", "main_archive", "ports_archive"])
-    def test_populate_arches(self, name: str):
-        r = PackageRepositoryCreateRequest(
-            name=name, url=PackageRepoUrl("ppa:foo/bar"), disable_sources=True
-        )
-        if name == "ports_archive":
-            assert r.arches == PACKAGE_REPO_PORTS_ARCHES
-        else:
-            assert r.arches == PACKAGE_REPO_MAIN_ARCHES
 
-    def test_to_builder(self):
+class TestPackageRepositoryCreateRequest:
+    @pytest.mark.parametrize(
+        "name, arches",
+        [
+            ("test", PACKAGE_REPO_MAIN_ARCHES),
+            ("main_archive", PACKAGE_REPO_MAIN_ARCHES),
+            ("ports_archive", PACKAGE_REPO_PORTS_ARCHES),
+        ],
+    )
+    def test_to_builder(self, name: str, arches: set[KnownArchesEnum]):
         r = PackageRepositoryCreateRequest(
-            name="test",
-            url=PackageRepoUrl("ppa:foo/bar"),
-            disable_sources=True,
+            name=name, url=PPA_URL, disable_sources=True
         )
+        assert r.arches == arches
         b = r.to_builder()
         assert b.name == r.name
         assert b.key == r.key
@@ -92,7 +93,7 @@ class TestPackageRepositoryUpdateRequest:
     ):
         r = PackageRepositoryUpdateRequest(
             name="test",
-            url=PackageRepoUrl("ppa:foo/bar"),
+            url=PPA_URL,
             disable_sources=True,
             enabled=enabled,
         )
@@ -120,7 +121,7 @@ class TestPackageRepositoryUpdateRequest:
     ):
         r = PackageRepositoryUpdateRequest(
             name="test",
-            url=PackageRepoUrl("ppa:foo/bar"),
+            url=PPA_URL,
             disable_sources=True,
             enabled=True,
             components=components,
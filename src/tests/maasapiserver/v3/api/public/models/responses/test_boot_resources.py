@@ -33,11 +33,15 @@ class TestBootResourceResponse:
             self_base_hyperlink=f"{V3_API_PREFIX}/boot_sources/1/selections/1/resources",
         )
 
-        assert boot_resource_response.id == boot_resource.id
-        assert boot_resource_response.os == "ubuntu"
-        assert boot_resource_response.release == "noble"
-        assert boot_resource_response.architecture == "amd64"
-        assert boot_resource_response.sub_architecture == "hwe-24.04"
+        assert boot_resource_response.dict(
+            include={"id", "os", "release", "architecture", "sub_architecture"}
+        ) == {
+            "id": boot_resource.id,
+            "os": "ubuntu",
+            "release": "noble",
+            "architecture": "amd64",
+            "sub_architecture": "hwe-24.04",
+        }
         assert (
             boot_resource_response.hal_links.self.href  # pyright: ignore[reportOptionalMemberAccess]
             == f"{V3_API_PREFIX}/boot_sources/1/selections/1/resources/{boot_resource.id}"
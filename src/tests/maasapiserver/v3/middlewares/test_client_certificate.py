@@ -1,85 +1,83 @@
 # Copyright 2025 Canonical Ltd.  This software is licensed under the
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
-from unittest.mock import Mock
-
 from fastapi import Response
 import pytest
 from starlette.requests import Request
-from starlette.types import ASGIApp
+from starlette.types import Receive, Scope, Send
 
 from maasapiserver.v3.middlewares.client_certificate import (
     RequireClientCertMiddleware,
 )
 
-
-@pytest.fixture
-def middleware():
-    return RequireClientCertMiddleware(Mock(ASGIApp))
+CLIENT_CN = "01f09d32-f508-6064-bd1c-c025a58dd068"
 
 
-@pytest.mark.asyncio
-class TestRequireClientCertMiddleware:
-    async def test_missing_client_cert_returns_403(self, middleware):
-        mock_scope = {
+def make_request(path: str, method: str = "GET", tls: dict | None = None):
+    return Request(
+        {
             "type": "http",
-            "method": "GET",
-            "path": "/secure-endpoint",
+            "method": method,
+            "path": path,
             "headers": [],
-            "extensions": {"tls": {"tls_used": True, "client_cert_chain": []}},
+            "extensions": {"tls": tls} if tls is not None else {},
         }
-        mock_request = Request(mock_scope)
+    )
 
-        async def mock_call_next(request):
-            return Response("OK")
 
-        response = await middleware.dispatch(mock_request, mock_call_next)
+async def call_next(request: Request) -> Response:
+    return Response("OK")
 
-        assert response.status_code == 403
-        assert response.body == b'{"detail":"Client certificate required."}'
 
-    async def test_valid_client_cert_allows_request(self, middleware):
-        mock_scope = {
-            "type": "http",
-            "method": "GET",
-            "path": "/secure-endpoint",
-            "headers": [],
-            "extensions": {
-                "tls": {"client_cn": "01f09d32-f508-6064-bd1c-c025a58dd068"},
-            },
-        }
-        mock_request = Request(mock_scope)
+async def noop_app(scope: Scope, receive: Receive, send: Send) -> None:
+    # The tests call dispatch() directly, so the wrapped app is never used.
+    pass
 
-        async def call_next(request):
-            return Response("OK")
 
-        response = await middleware.dispatch(mock_request, call_next)
+@pytest.fixture(scope="module")
+def middleware():
+    # The middleware keeps no per-request state, so one instance is enough.
+    return RequireClientCertMiddleware(noop_app)
 
-        assert response.status_code == 200
-        assert response.body == b"OK"
 
-    async def test_missing_client_cert_for_agent_enroll_allows_request(
-        self, middleware
+@pytest.mark.asyncio
+class TestRequireClientCertMiddleware:
+    @pytest.mark.parametrize(
+        "request_, status_code, body",
+        [
+            (
+                make_request(
+                    "/secure-endpoint",
+                    tls={"tls_used": True, "client_cert_chain": []},
+                ),
+                403,
+                b'{"detail":"Client certificate required."}',
+            ),
+            (
+                make_request("/secure-endpoint", tls={"client_cn": CLIENT_CN}),
+                200,
+                b"OK",
+            ),
+            (
+                make_request("/v3/agents:enroll", method="POST"),
+                200,
+                b"OK",
+            ),
+        ],
+        ids=[
+            "missing_client_cert",
+            "valid_client_cert",
+            "missing_client_cert_for_agent_enroll",
+        ],
+    )
+    async def test_dispatch(
+        self,
+        middleware: RequireClientCertMiddleware,
+        request_: Request,
+        status_code: int,
+        body: bytes,
     ):
-        mock_request = type(
-            "Request",
-            (),
-            {
-                "scope": {
-                    "headers": [],
-                    "path": "/v3/agents:enroll",
-                    "method": "POST",
-                }
-            },
-        )
-        mock_request_instance = mock_request()
-
-        async def mock_call_next(request):
-            return Response("OK")
-
-        response = await middleware.dispatch(
-            mock_request_instance, mock_call_next
-        )
+        response = await middleware.dispatch(request_, call_next)
 
-        assert response.status_code == 200
-        assert response.body == b"OK"
+        assert response.status_code == status_code
+        assert response.body == body
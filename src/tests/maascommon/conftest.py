@@ -72,6 +72,9 @@ class StubOpenFGAServer:
     def __init__(self):
         self.allowed = True
         self.last_payload = None
+        self.batch_check_payloads = []
+        self.batch_check_response = None
+        self.denied_users = set()
         self.status_code = 200
         self.list_objects_response = {"objects": []}
 
@@ -81,6 +84,25 @@ class StubOpenFGAServer:
             return web.Response(status=self.status_code)
         return web.json_response({"allowed": self.allowed, "resolution": ""})
 
+    async def batch_check_handler(self, request):
+        self.last_payload = await request.json()
+        self.batch_check_payloads.append(self.last_payload)
+        if self.status_code != 200:
+            return web.Response(status=self.status_code)
+        if self.batch_check_response is not None:
+            return web.json_response(self.batch_check_response)
+        return web.json_response(
+            {
+                "result": {
+                    check["correlation_id"]: {
+                        "allowed": self.allowed
+                        and check["tuple_key"]["user"] not in self.denied_users
+                    }
+                    for check in self.last_payload["checks"]
+                }
+            }
+        )
+
     async def list_objects_handler(self, request):
         self.last_payload = await request.json()
         if self.status_code != 200:
@@ -97,6 +119,10 @@ async def stub_openfga_server(tmp_path: Path):
     app.router.add_post(
         f"/stores/{OPENFGA_STORE_ID}/check", handler_store.check_handler
     )
+    app.router.add_post(
+        f"/stores/{OPENFGA_STORE_ID}/batch-check",
+        handler_store.batch_check_handler,
+    )
     app.router.add_post(
         f"/stores/{OPENFGA_STORE_ID}/list-objects",
         handler_store.list_objects_handler,
@@ -4,7 +4,10 @@
 import httpx
 import pytest
 
-from maascommon.openfga.async_client import OpenFGAClient
+from maascommon.openfga.async_client import (
+    OpenFGABatchCheckError,
+    OpenFGAClient,
+)
 from tests.maascommon.openfga.base import LIST_METHODS, PERMISSION_METHODS
 
 
@@ -44,6 +47,79 @@ class TestOpenFGAClient:
         assert server.last_payload["relation"] == rel
         assert server.last_payload["type"] == "pool"
 
+    async def test_batch_check(self, client, stub_openfga_server):
+        server, _ = stub_openfga_server
+
+        result = await client.batch_check(
+            [
+                (1, "can_edit_machines", "maas:0"),
+                (2, "can_view_machines", "pool:1"),
+            ]
+        )
+
+        assert result == [True, True]
+        assert server.last_payload["checks"] == [
+            {
+                "tuple_key": {
+                    "user": "user:1",
+                    "relation": "can_edit_machines",
+                    "object": "maas:0",
+                },
+                "correlation_id": "0",
+            },
+            {
+                "tuple_key": {
+                    "user": "user:2",
+                    "relation": "can_view_machines",
+                    "object": "pool:1",
+                },
+                "correlation_id": "1",
+            },
+        ]
+
+    async def test_batch_check_splits_large_batches(
+        self, client, stub_openfga_server
+    ):
+        server, _ = stub_openfga_server
+        size = client.MAX_CHECKS_PER_BATCH_CHECK
+        server.denied_users = {f"user:{i}" for i in range(1, 2 * size, 2)}
+        checks = [
+            (i, "can_edit_machines", "maas:0") for i in range(2 * size + 1)
+        ]
+
+        result = await client.batch_check(checks)
+
+        assert result == [i % 2 == 0 for i in range(len(checks))]
+        # The batches are sent concurrently, so they may arrive in any order.
+        batches = sorted(
+            (
+                [
+                    int(check["tuple_key"]["user"][5:])
+                    for check in payload["checks"]
+                ]
+                for payload in server.batch_check_payloads
+            ),
+            key=lambda users: users[0],
+        )
+        assert [len(users) for users in batches] == [size, size, 1]
+        assert sum(batches, []) == list(range(len(checks)))
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"result": {}},
+            {"result": {"0": {"error": {"message": "timeout"}}}},
+        ],
+    )
+    async def test_batch_check_raises_for_missing_or_failed_checks(
+        self, client, stub_openfga_server, response
+    ):
+        server, _ = stub_openfga_server
+        server.batch_check_response = response
+
+        with pytest.raises(OpenFGABatchCheckError):
+            await client.batch_check([(1, "can_edit_machines", "maas:0")])
+
     @pytest.mark.parametrize("status", [403, 500])
     async def test_async_raises_for_status(
         self, client, stub_openfga_server, status
@@ -57,11 +133,19 @@ class TestOpenFGAClient:
         with pytest.raises(httpx.HTTPStatusError):
             await client.list_pools_with_view_machines_access(1)
 
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.batch_check([(1, "can_edit_machines", "maas:0")])
+
     async def test_async_client_closes_properly(self):
         client = OpenFGAClient()
         await client.close()
         assert client.client.is_closed
 
+    async def test_async_client_closes_on_context_exit(self):
+        async with OpenFGAClient() as client:
+            assert not client.client.is_closed
+        assert client.client.is_closed
+
     async def test_socket_path_is_set_from_env(self, monkeypatch):
         test_socket_path = "/tmp/test_socket"
         monkeypatch.setenv("MAAS_OPENFGA_HTTP_SOCKET_PATH", test_socket_path)
@@ -6,8 +6,8 @@ from tests.utils.ulid import is_ulid
 
 
 class TestUlid:
-    def test_ulid_uniqueness_and_correctness(self, monkeypatch):
-        ulids = {generate_ulid() for _ in range(100)}
-        assert len(ulids) == 100  # Ensure all ULIDs are unique
+    def test_ulid_uniqueness_and_correctness(self):
+        ulids = [generate_ulid() for _ in range(100)]
+        assert len(set(ulids)) == len(ulids)  # Ensure all ULIDs are unique
         for u in ulids:
             assert is_ulid(u) is True
@@ -5,6 +5,10 @@ import pytest
 
 from maasservicelayer.builders.openfga_tuple import OpenFGATupleBuilder
 
+GROUP_ID = 1
+POOL_ID = "1"
+GROUP_MEMBERS = f"group:{GROUP_ID}#member"
+
 
 class TestOpenFGATupleBuilder:
     def test_default_initialization(self):
@@ -38,16 +42,13 @@ class TestOpenFGATupleBuilder:
         ],
     )
     def test_group_pool_scoped_builders(self, method_name, relation):
-        group_id = 1
-        pool_id = "1"
-
         method = getattr(OpenFGATupleBuilder, method_name)
-        builder = method(group_id, pool_id)
+        builder = method(GROUP_ID, POOL_ID)
 
-        assert builder.user == f"group:{group_id}#member"
+        assert builder.user == GROUP_MEMBERS
         assert builder.user_type == "userset"
         assert builder.relation == relation
-        assert builder.object_id == pool_id
+        assert builder.object_id == POOL_ID
         assert builder.object_type == "pool"
 
     @pytest.mark.parametrize(
@@ -89,12 +90,10 @@ class TestOpenFGATupleBuilder:
         ],
     )
     def test_group_global_scoped_builders(self, method_name, relation):
-        group_id = 1
-
         method = getattr(OpenFGATupleBuilder, method_name)
-        builder = method(group_id)
+        builder = method(GROUP_ID)
 
-        assert builder.user == f"group:{group_id}#member"
+        assert builder.user == GROUP_MEMBERS
         assert builder.user_type == "userset"
         assert builder.relation == relation
         assert builder.object_id == "0"
@@ -13,9 +13,15 @@ from maasservicelayer.db.repositories.agents import (
     AgentsRepository,
 )
 from maasservicelayer.models.agents import Agent
-from tests.fixtures.factories.agents import create_test_agents_entry
+from tests.fixtures.factories.agents import (
+    create_n_test_agents_entries,
+    create_test_agents_entry,
+)
 from tests.fixtures.factories.node import create_test_rack_controller_entry
-from tests.fixtures.factories.racks import create_test_rack_entry
+from tests.fixtures.factories.racks import (
+    create_n_test_rack_entries,
+    create_test_rack_entry,
+)
 from tests.maasapiserver.fixtures.db import Fixture
 from tests.maasservicelayer.db.repositories.base import RepositoryCommonTests
 
@@ -71,24 +77,19 @@ class TestAgentsRepository(RepositoryCommonTests[Agent]):
     async def _setup_test_list(
         self, fixture: Fixture, num_objects: int
     ) -> list[Agent]:
-        racks = [
-            await create_test_rack_entry(fixture, name=f"rack-{i}")
-            for i in range(num_objects)
-        ]
+        racks = await create_n_test_rack_entries(fixture, num_objects)
         rack_controllers = [
             await create_test_rack_controller_entry(fixture)
             for _ in range(num_objects)
         ]
 
-        return [
-            await create_test_agents_entry(
-                fixture,
-                uuid=str(uuid4()),
-                rack_id=racks[i].id,
-                rackcontroller_id=rack_controllers[i]["id"],
-            )
-            for i in range(num_objects)
-        ]
+        return await create_n_test_agents_entries(
+            fixture,
+            rack_ids=[rack.id for rack in racks],
+            rackcontroller_ids=[
+                rack_controller["id"] for rack_controller in rack_controllers
+            ],
+        )
 
     @pytest.fixture
     async def created_instance(self, fixture: Fixture) -> Agent:
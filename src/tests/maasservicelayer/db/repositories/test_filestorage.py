@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncConnection
 
 from maasservicelayer.builders.filestorage import FileStorageBuilder
 from maasservicelayer.context import Context
-from maasservicelayer.db.filters import QuerySpec
+from maasservicelayer.db.filters import Clause, QuerySpec
 from maasservicelayer.db.repositories.base import BaseRepository
 from maasservicelayer.db.repositories.filestorage import (
     FileStorageClauseFactory,
@@ -17,54 +17,45 @@ from maasservicelayer.db.repositories.filestorage import (
 )
 from maasservicelayer.models.base import ResourceBuilder
 from maasservicelayer.models.filestorage import FileStorage
-from tests.fixtures.factories.filestorage import create_test_filestorage_entry
+from tests.fixtures.factories.filestorage import (
+    create_n_test_filestorage_entries,
+    create_test_filestorage_entry,
+)
 from tests.maasapiserver.fixtures.db import Fixture
 from tests.maasservicelayer.db.repositories.base import RepositoryCommonTests
 
 
 class TestFilestorageClauseFactory:
-    def test_with_owner_id(self):
-        clause = FileStorageClauseFactory.with_owner_id(1)
-        assert (
-            str(
-                clause.condition.compile(
-                    compile_kwargs={"literal_binds": True}
-                )
-            )
-            == "maasserver_filestorage.owner_id = 1"
-        )
-
-    def test_with_key(self):
-        clause = FileStorageClauseFactory.with_key("file_key")
+    @pytest.mark.parametrize(
+        "clause, expected",
+        [
+            (
+                FileStorageClauseFactory.with_owner_id(1),
+                "maasserver_filestorage.owner_id = 1",
+            ),
+            (
+                FileStorageClauseFactory.with_key("file_key"),
+                "maasserver_filestorage.key = 'file_key'",
+            ),
+            (
+                FileStorageClauseFactory.with_filename("test_file.sh"),
+                "maasserver_filestorage.filename = 'test_file.sh'",
+            ),
+            (
+                FileStorageClauseFactory.with_filename_prefix("maasfile_"),
+                "lower(maasserver_filestorage.filename) LIKE lower('maasfile_%')",
+            ),
+        ],
+        ids=["owner_id", "key", "filename", "filename_prefix"],
+    )
+    def test_clause(self, clause: Clause, expected: str):
         assert (
             str(
                 clause.condition.compile(
                     compile_kwargs={"literal_binds": True}
                 )
             )
-            == "maasserver_filestorage.key = 'file_key'"
-        )
-
-    def test_with_filename(self):
-        clause = FileStorageClauseFactory.with_filename("test_file.sh")
-        assert (
-            str(
-                clause.condition.compile(
-                    compile_kwargs={"literal_binds": True}
-                )
-            )
-            == "maasserver_filestorage.filename = 'test_file.sh'"
-        )
-
-    def test_with_filename_prefix(self):
-        clause = FileStorageClauseFactory.with_filename_prefix("maasfile_")
-        assert (
-            str(
-                clause.condition.compile(
-                    compile_kwargs={"literal_binds": True}
-                )
-            )
-            == "lower(maasserver_filestorage.filename) LIKE lower('maasfile_%')"
+            == expected
         )
 
 
@@ -79,15 +70,7 @@ class TestFilestorageRepository(RepositoryCommonTests[FileStorage]):
     async def _setup_test_list(
         self, fixture: Fixture, num_objects: int
     ) -> list[FileStorage]:
-        return [
-            await create_test_filestorage_entry(
-                fixture,
-                key=f"key-{i}",
-                filename=f"filename-{i}",
-                content=b64encode(f"content-{i}".encode()).decode(),
-            )
-            for i in range(num_objects)
-        ]
+        return await create_n_test_filestorage_entries(fixture, num_objects)
 
     @pytest.fixture
     async def instance_builder(self, *args, **kwargs) -> ResourceBuilder:
@@ -166,12 +149,18 @@ class TestFilestorageRepository(RepositoryCommonTests[FileStorage]):
         _setup_test_list: list[FileStorage],
         num_objects: int,
     ) -> None:
-        files = await repository_instance.get_many(query=QuerySpec())
+        expected_contents = [
+            (content, b64encode(content).decode())
+            for content in (
+                f"content-{i}".encode("utf-8") for i in range(num_objects)
+            )
+        ]
 
-        for idx, file in enumerate(files):
-            expected_content = f"content-{idx}".encode("utf-8")
-            encoded_content = b64encode(expected_content).decode()
+        files = await repository_instance.get_many(query=QuerySpec())
 
+        for file, (expected_content, encoded_content) in zip(
+            files, expected_contents, strict=True
+        ):
             assert type(file.content) is bytes
             assert file.content != encoded_content
             assert file.content == expected_content
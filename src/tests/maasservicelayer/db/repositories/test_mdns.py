@@ -14,7 +14,10 @@ from maasservicelayer.db.repositories.mdns import (
 )
 from maasservicelayer.models.mdns import MDNS
 from tests.fixtures.factories.interface import create_test_interface_entry
-from tests.fixtures.factories.mdns import create_test_mdns_entry
+from tests.fixtures.factories.mdns import (
+    create_n_test_mdns_entries,
+    create_test_mdns_entry,
+)
 from tests.maasapiserver.fixtures.db import Fixture
 from tests.maasservicelayer.db.repositories.base import RepositoryCommonTests
 
@@ -39,15 +42,9 @@ class TestMDNSRepository(RepositoryCommonTests[MDNS]):
         self, fixture: Fixture, num_objects: int
     ) -> list[MDNS]:
         interface = await create_test_interface_entry(fixture)
-        return [
-            await create_test_mdns_entry(
-                fixture,
-                hostname="foo",
-                ip=f"10.0.0.{i + 1}",
-                interface_id=interface.id,
-            )
-            for i in range(num_objects)
-        ]
+        return await create_n_test_mdns_entries(
+            fixture, num_objects, hostname="foo", interface_id=interface.id
+        )
 
     @pytest.fixture
     async def created_instance(self, fixture: Fixture) -> MDNS:
@@ -115,6 +115,47 @@ class TestOpenFGATuplesRepository:
         assert t.object_id == "0"
         assert t.object_type == "group"
 
+    async def test_upsert_many(
+        self, db_connection: AsyncConnection, fixture: Fixture
+    ) -> None:
+        repository = OpenFGATuplesRepository(Context(connection=db_connection))
+
+        await create_openfga_tuple(
+            fixture,
+            user="user:alice",
+            user_type="user",
+            relation="member",
+            object_type="group",
+            object_id="admins",
+        )
+
+        tuples = await repository.upsert_many(
+            [
+                OpenFGATupleBuilder(
+                    user=f"user:{name}",
+                    user_type="user",
+                    relation="member",
+                    object_type="group",
+                    object_id="admins",
+                )
+                for name in ("bob", "alice")
+            ]
+        )
+
+        assert [t.user for t in tuples] == ["user:bob", "user:alice"]
+        retrieved_tuples = await fixture.get(
+            OpenFGATupleTable.fullname,
+            eq(OpenFGATupleTable.c.object_id, "admins"),
+        )
+        assert len(retrieved_tuples) == 2
+        assert len({t["ulid"] for t in retrieved_tuples}) == 2
+
+    async def test_upsert_many_empty(
+        self, db_connection: AsyncConnection
+    ) -> None:
+        repository = OpenFGATuplesRepository(Context(connection=db_connection))
+        assert await repository.upsert_many([]) == []
+
     async def test_delete_many(
         self, db_connection: AsyncConnection, fixture: Fixture
     ) -> None:
@@ -20,11 +20,53 @@ from maasservicelayer.db.repositories.package_repositories import (
 from maasservicelayer.models.fields import PackageRepoUrl
 from maasservicelayer.models.package_repositories import PackageRepository
 from tests.fixtures.factories.package_repositories import (
+    create_n_test_package_repositories,
     create_test_package_repository,
 )
 from tests.maasapiserver.fixtures.db import Fixture
 from tests.maasservicelayer.db.repositories.base import RepositoryCommonTests
 
+# The default package repositories are created by the migration and it
+# has the following timestamp hardcoded in the test sql dump,
+# see src/maasserver/testing/inital.maas_test.sql:9243
+_DEFAULT_REPOS_TS = datetime(
+    2025, 10, 17, 10, 15, 20, 698940, tzinfo=timezone.utc
+)
+DEFAULT_PACKAGE_REPOSITORIES = (
+    PackageRepository(
+        id=1,
+        created=_DEFAULT_REPOS_TS,
+        updated=_DEFAULT_REPOS_TS,
+        name="main_archive",
+        url=PackageRepoUrl("http://archive.ubuntu.com/ubuntu"),
+        components=set(),
+        arches=PACKAGE_REPO_MAIN_ARCHES,
+        key="",
+        default=True,
+        enabled=True,
+        disabled_pockets=set(),
+        distributions=[],
+        disabled_components=set(),
+        disable_sources=True,
+    ),
+    PackageRepository(
+        id=2,
+        created=_DEFAULT_REPOS_TS,
+        updated=_DEFAULT_REPOS_TS,
+        name="ports_archive",
+        url=PackageRepoUrl("http://ports.ubuntu.com/ubuntu-ports"),
+        components=set(),
+        arches=PACKAGE_REPO_PORTS_ARCHES,
+        key="",
+        default=True,
+        enabled=True,
+        disabled_pockets=set(),
+        distributions=[],
+        disabled_components=set(),
+        disable_sources=True,
+    ),
+)
+
 
 class TestCommonPackageRepositoriesRepository(
     RepositoryCommonTests[PackageRepository]
@@ -41,53 +83,12 @@ class TestCommonPackageRepositoriesRepository(
     async def _setup_test_list(
         self, fixture: Fixture, num_objects: int
     ) -> list[PackageRepository]:
-        # The default package repositories are created by the migration and it
-        # has the following timestamp hardcoded in the test sql dump,
-        # see src/maasserver/testing/inital.maas_test.sql:9243
-        ts = datetime(2025, 10, 17, 10, 15, 20, 698940, tzinfo=timezone.utc)
-        created_package_repositories = [
-            PackageRepository(
-                id=1,
-                created=ts,
-                updated=ts,
-                name="main_archive",
-                url=PackageRepoUrl("http://archive.ubuntu.com/ubuntu"),
-                components=set(),
-                arches=PACKAGE_REPO_MAIN_ARCHES,
-                key="",
-                default=True,
-                enabled=True,
-                disabled_pockets=set(),
-                distributions=[],
-                disabled_components=set(),
-                disable_sources=True,
-            ),
-            PackageRepository(
-                id=2,
-                created=ts,
-                updated=ts,
-                name="ports_archive",
-                url=PackageRepoUrl("http://ports.ubuntu.com/ubuntu-ports"),
-                components=set(),
-                arches=PACKAGE_REPO_PORTS_ARCHES,
-                key="",
-                default=True,
-                enabled=True,
-                disabled_pockets=set(),
-                distributions=[],
-                disabled_components=set(),
-                disable_sources=True,
-            ),
-        ]
-        created_package_repositories.extend(
-            [
-                await create_test_package_repository(
-                    fixture, name=f"test-{i}", default=False
-                )
-                for i in range(num_objects - 2)
-            ]
+        created_package_repositories = (
+            await create_n_test_package_repositories(
+                fixture, num_objects - 2, default=False
+            )
         )
-        return created_package_repositories
+        return [*DEFAULT_PACKAGE_REPOSITORIES, *created_package_repositories]
 
     @pytest.fixture
     async def created_instance(self, fixture: Fixture) -> PackageRepository:
@@ -53,29 +53,23 @@ class TestBootSourcesService(ServiceCommonTests):
             skip_keyring_verification=False,
         )
 
-    async def test_delete(self, test_instance):
+    async def test_delete(self, service_instance, test_instance):
         boot_source = test_instance
 
-        repository_mock = Mock(BootSourcesRepository)
+        repository_mock = service_instance.repository
         repository_mock.get_one.return_value = boot_source
         repository_mock.delete_by_id.return_value = boot_source
 
-        boot_source_cache_service_mock = Mock(BootSourceCacheService)
-        boot_source_selections_service_mock = Mock(BootSourceSelectionsService)
-        image_manifests_service = Mock(ImageManifestsService)
-        events_service_mock = Mock(EventsService)
-
-        boot_source_service = BootSourcesService(
-            context=Context(),
-            repository=repository_mock,
-            boot_source_cache_service=boot_source_cache_service_mock,
-            boot_source_selections_service=boot_source_selections_service_mock,
-            image_manifests_service=image_manifests_service,
-            events_service=events_service_mock,
+        boot_source_cache_service_mock = (
+            service_instance.boot_source_cache_service
+        )
+        boot_source_selections_service_mock = (
+            service_instance.boot_source_selections_service
         )
+        image_manifests_service = service_instance.image_manifests_service
 
         query = Mock(QuerySpec)
-        await boot_source_service.delete_one(query)
+        await service_instance.delete_one(query)
 
         repository_mock.delete_by_id.assert_called_once_with(id=boot_source.id)
 
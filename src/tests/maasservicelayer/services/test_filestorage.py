@@ -1,9 +1,7 @@
 #  Copyright 2025 Canonical Ltd.  This software is licensed under the
 #  GNU Affero General Public License version 3 (see the file LICENSE).
-from io import BytesIO
 from unittest.mock import Mock
 
-from fastapi import UploadFile
 import pytest
 
 from maasservicelayer.builders.filestorage import FileStorageBuilder
@@ -13,6 +11,8 @@ from maasservicelayer.models.filestorage import FileStorage
 from maasservicelayer.services.filestorage import FileStorageService
 from tests.maasservicelayer.services.base import ServiceCommonTests
 
+TEST_FILE_CONTENT = b"0" * 1024
+
 
 @pytest.mark.asyncio
 class TestFileStorageService(ServiceCommonTests):
@@ -33,17 +33,6 @@ class TestFileStorageService(ServiceCommonTests):
             owner_id=None,
         )
 
-    def create_dummy_binary_upload_file(
-        self,
-        filename: str | None = "test.bin",
-        size_in_bytes: int | None = 1024,
-    ) -> UploadFile:
-        return UploadFile(
-            file=BytesIO(b"0" * size_in_bytes),
-            filename=filename,
-            size=1024,
-        )
-
     async def test_create(
         self,
         service_instance,
@@ -59,21 +48,17 @@ class TestFileStorageService(ServiceCommonTests):
         test_file_name = "test.bin"
         test_file_key = "test_file_key"
 
-        test_file = self.create_dummy_binary_upload_file(test_file_name)
-        test_file_content = await test_file.read()
-        await test_file.seek(0)
-
         expected_filestorage = FileStorage(
             id=0,
             filename=test_file_name,
-            content=test_file_content,
+            content=TEST_FILE_CONTENT,
             key=test_file_key,
             owner_id=None,
         )
 
         file_storage_builder = FileStorageBuilder(
             filename=test_file_name,
-            content=test_file_content,
+            content=TEST_FILE_CONTENT,
             key=test_file_key,
             owner_id=None,
         )
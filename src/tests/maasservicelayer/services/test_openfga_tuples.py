@@ -104,6 +104,35 @@ class TestIntegrationOpenFGAService:
         assert retrieved_tuple[0]["object_id"] == "2000"
         assert retrieved_tuple[0]["relation"] == "member"
 
+    async def test_upsert_many(
+        self,
+        fixture: Fixture,
+        services: ServiceCollectionV3,
+    ):
+        await services.openfga_tuples.upsert_many(
+            [
+                OpenFGATupleBuilder.build_pool("1000"),
+                OpenFGATupleBuilder.build_user_member_group(1, 2000),
+            ]
+        )
+        retrieved_pool = await fixture.get(
+            OpenFGATupleTable.fullname,
+            and_(
+                eq(OpenFGATupleTable.c.object_type, "pool"),
+                eq(OpenFGATupleTable.c.object_id, "1000"),
+            ),
+        )
+        assert len(retrieved_pool) == 1
+        retrieved_member = await fixture.get(
+            OpenFGATupleTable.fullname,
+            and_(
+                eq(OpenFGATupleTable.c.object_type, "group"),
+                eq(OpenFGATupleTable.c.object_id, "2000"),
+                eq(OpenFGATupleTable.c._user, "user:1"),
+            ),
+        )
+        assert len(retrieved_member) == 1
+
     async def test_delete_many(
         self, fixture: Fixture, services: ServiceCollectionV3
     ):
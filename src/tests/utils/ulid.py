@@ -1,10 +1,14 @@
 # Copyright 2026 Canonical Ltd.  This software is licensed under the
 # GNU Affero General Public License version 3 (see the file LICENSE).
 
+# ULIDs are base32 encoded using Crockford's base32 alphabet
+CROCKFORD_BASE32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Translation table deleting every valid character, so that anything left
+# over after translating is not part of the alphabet.
+_STRIP_CROCKFORD_BASE32 = str.maketrans("", "", CROCKFORD_BASE32)
+
 
 def is_ulid(value: str) -> bool:
     if len(value) != 26:
         return False
-    # ULIDs are base32 encoded using Crockford's base32 alphabet
-    crockford_base32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
-    return all(c in crockford_base32 for c in value.upper())
+    return not value.upper().translate(_STRIP_CROCKFORD_BASE32)